@@ -1,26 +1,36 @@
 from __future__ import annotations
 
+import logging
+import time
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import event, pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from app.core.config import settings
+from app.domain.models import auth_event  # noqa: F401
+from app.domain.models import email_outbox  # noqa: F401
 from app.domain.models import refresh_token  # noqa: F401
 from app.domain.models import user  # noqa: F401
 from app.infrastructure.db.base import Base
+from app.infrastructure.db.migrations import LockRiskChecker, is_lock_timeout
 
 config = context.config
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+logger = logging.getLogger("alembic.env")
+
 config.set_main_option("sqlalchemy.url", settings.database_uri)
 
 target_metadata = Base.metadata
 
+# `alembic -x online=true upgrade head` applies migrations without long-held locks.
+ONLINE = context.get_x_argument(as_dictionary=True).get("online", "").lower() in ("1", "true")
+
 
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
@@ -38,6 +48,34 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
+def do_run_migrations_low_lock(connection: Connection) -> None:
+    # Fail fast instead of queueing behind long transactions while every later
+    # query on the table queues behind us.
+    connection.exec_driver_sql(f"SET lock_timeout = {settings.migration_lock_timeout_ms}")
+    connection.commit()
+    event.listen(connection, "before_cursor_execute", LockRiskChecker().guard)
+    # One transaction per revision, so a retry resumes from the last applied one.
+    context.configure(connection=connection, target_metadata=target_metadata,
+                      transaction_per_migration=True)
+
+    attempt = 0
+    while True:
+        try:
+            with context.begin_transaction():
+                context.run_migrations()
+            return
+        except Exception as exc:
+            if not is_lock_timeout(exc) or attempt >= settings.migration_lock_retries:
+                raise
+            if connection.in_transaction():
+                connection.rollback()
+            delay = settings.migration_retry_backoff_seconds * 2**attempt
+            attempt += 1
+            logger.warning("lock_timeout hit, retrying in %.1fs (%d/%d)",
+                           delay, attempt, settings.migration_lock_retries)
+            time.sleep(delay)
+
+
 async def run_migrations_online() -> None:
     connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
@@ -46,8 +84,9 @@ async def run_migrations_online() -> None:
         future=True,
     )
 
-    async with connectable.begin() as connection:
-        await connection.run_sync(do_run_migrations)
+    # Alembic owns the transactions so autocommit blocks (CREATE INDEX CONCURRENTLY) work.
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations_low_lock if ONLINE else do_run_migrations)
 
     await connectable.dispose()
 
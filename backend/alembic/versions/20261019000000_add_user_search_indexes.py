@@ -0,0 +1,33 @@
+"""add trigram search indexes on users
+
+Revision ID: 20261019000000
+Revises: 20250101000000
+Create Date: 2026-10-19 00:00:00
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+from app.infrastructure.db.migrations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019000000"
+down_revision = "20250101000000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    create_index_concurrently("ix_users_email_trgm", "users", ["email"],
+                              postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"})
+    create_index_concurrently("ix_users_full_name_trgm", "users", ["full_name"],
+                              postgresql_using="gin",
+                              postgresql_ops={"full_name": "gin_trgm_ops"})
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_users_full_name_trgm", "users")
+    drop_index_concurrently("ix_users_email_trgm", "users")
@@ -0,0 +1,58 @@
+"""create partitioned auth events table
+
+Revision ID: 20261019020000
+Revises: 20261019010000
+Create Date: 2026-10-19 02:00:00
+
+"""
+from __future__ import annotations
+
+from datetime import UTC, date, datetime
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019020000"
+down_revision = "20261019010000"
+branch_labels = None
+depends_on = None
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "auth_events",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("event_type", sa.String(length=64), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("data", postgresql.JSONB(), nullable=False,
+                  server_default=sa.text("'{}'::jsonb")),
+        sa.PrimaryKeyConstraint("id", "occurred_at"),
+        postgresql_partition_by="RANGE (occurred_at)",
+    )
+    op.create_index("ix_auth_events_user_id_occurred_at",
+                    "auth_events", ["user_id", "occurred_at"], unique=False)
+    op.create_index("ix_auth_events_event_type_occurred_at",
+                    "auth_events", ["event_type", "occurred_at"], unique=False)
+
+    # Later months are created ahead of time by the maintain_auth_event_partitions task.
+    op.execute("CREATE TABLE auth_events_default PARTITION OF auth_events DEFAULT")
+    month = datetime.now(UTC).date().replace(day=1)
+    for _ in range(3):
+        upper = _next_month(month)
+        op.execute(
+            f"CREATE TABLE auth_events_{month:%Y%m} PARTITION OF auth_events "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') TO ('{upper.isoformat()} 00:00+00')"
+        )
+        month = upper
+
+
+def downgrade() -> None:
+    op.drop_table("auth_events")
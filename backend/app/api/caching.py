@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Response, status
+
+CACHE_CONTROL = "private, no-cache"
+ETAG_ENCODINGS = ("gzip", "br")
+
+
+def make_etag(*parts: object) -> str:
+    digest = hashlib.blake2b("|".join(str(part) for part in parts).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    # Strong validators must differ per content-coding (RFC 9110 §8.8.3).
+    if etag.startswith("W/") or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _strip_encoding(etag: str) -> str:
+    for encoding in ETAG_ENCODINGS:
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag.removesuffix(suffix) + '"'
+    return etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function (RFC 9110 §13.1.2); a compressed
+    # variant of the same representation also matches.
+    return any(_strip_encoding(candidate.strip().removeprefix("W/")) == etag
+               for candidate in if_none_match.split(","))
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import time
 from collections.abc import AsyncGenerator
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.deadline import bounded
 from app.core.security import decode_token, get_subject, get_token_identifier, is_token_type
-from app.infrastructure.cache.redis import get_redis_client
-from app.infrastructure.db.repositories.users import UserRepository
+from app.infrastructure.cache.keys import access_token_key, legacy_access_token_key
+from app.infrastructure.cache.redis import RedisClient, get_redis_client
+from app.infrastructure.db.loaders import user_loader
 from app.infrastructure.db.session import SessionLocal
 from app.schemas.user import UserRead
 from app.services.auth import AuthService
@@ -18,27 +21,30 @@ from app.services.auth import AuthService
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# Nothing writes the legacy access-token layout any more, so its keys are gone one
+# access-token TTL after deploy; a worker stops looking for them after that long.
+legacy_access_keys_until = time.monotonic() + settings.jwt_expires_in_seconds
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
         yield session
 
 
-async def get_redis() -> Redis:
+async def get_redis() -> RedisClient:
     return await get_redis_client()
 
 
 async def get_auth_service(
     session: AsyncSession = Depends(get_session),
-    redis: Redis = Depends(get_redis),
+    redis: RedisClient = Depends(get_redis),
 ) -> AuthService:
     return AuthService(session, redis)
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
-    session: AsyncSession = Depends(get_session),
-    redis: Redis = Depends(get_redis),
+    redis: RedisClient = Depends(get_redis),
 ) -> UserRead:
     if credentials is None:
         raise HTTPException(
@@ -56,17 +62,25 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Wrong token type")
 
     token_id = get_token_identifier(payload)
-    cache_key = f"access:{token_id}"
-    cached_user_id = await redis.get(cache_key)
-    if cached_user_id is None:
+    subject = UUID(get_subject(payload))
+    async with bounded("redis"):
+        token_active = await redis.exists(access_token_key(subject, token_id))
+        if not token_active and time.monotonic() < legacy_access_keys_until:
+            token_active = await redis.exists(legacy_access_token_key(token_id))
+    if not token_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
 
-    subject = UUID(get_subject(payload))
-    user_repo = UserRepository(session)
-    user = await user_repo.get(subject)
+    user = await user_loader.load(subject)
     if user is None or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user")
 
-    return UserRead.model_validate(user)
+    return user
+
+
+async def get_current_superuser(current_user: UserRead = Depends(get_current_user)) -> UserRead:
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges")
+    return current_user
@@ -0,0 +1,12 @@
+from .admission import AdaptiveLimiter, AdmissionControlMiddleware
+from .compression import CompressionMiddleware
+from .deadline import DeadlineMiddleware
+from .memory import MemoryTrackingMiddleware
+
+__all__ = [
+    "AdaptiveLimiter",
+    "AdmissionControlMiddleware",
+    "CompressionMiddleware",
+    "DeadlineMiddleware",
+    "MemoryTrackingMiddleware",
+]
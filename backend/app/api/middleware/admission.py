@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import Sequence
+from typing import Any
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.deadline import remaining
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+# AIMD concurrency limit: grows by ~1 per window of fast completions and shrinks
+# multiplicatively (at most once per observed latency) when completions are slow.
+class AdaptiveLimiter:
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial_limit: int,
+        max_limit: int,
+        target_latency_ms: int,
+        min_limit: int = 1,
+        backoff: float = 0.9,
+        max_queue: int = 100,
+    ) -> None:
+        self.name = name
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency_ms / 1000
+        self.backoff = backoff
+        self.max_queue = max_queue
+        self.inflight = 0
+        self.accepted = 0
+        self.rejected = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._last_decrease = 0.0
+
+    async def acquire(self, timeout: float) -> bool:
+        if self.inflight < int(self.limit) and not self._waiters:
+            self.inflight += 1
+            self.accepted += 1
+            return True
+        if len(self._waiters) >= self.max_queue or timeout <= 0:
+            self.rejected += 1
+            return False
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except (TimeoutError, asyncio.CancelledError) as exc:
+            granted = waiter.done() and not waiter.cancelled()
+            if not granted:
+                waiter.cancel()
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            if isinstance(exc, asyncio.CancelledError):
+                if granted:
+                    self.release(None)
+                raise
+            if not granted:
+                self.rejected += 1
+                return False
+        self.accepted += 1
+        return True
+
+    def release(self, latency: float | None) -> None:
+        self.inflight -= 1
+        if latency is not None:
+            self._adjust(latency)
+        while self._waiters and self.inflight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.inflight += 1
+                waiter.set_result(None)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "limit": round(self.limit, 2),
+            "inflight": self.inflight,
+            "queued": len(self._waiters),
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "target_latency_ms": self.target_latency * 1000,
+        }
+
+    def _adjust(self, latency: float) -> None:
+        if latency <= self.target_latency:
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            return
+        now = time.monotonic()
+        if now - self._last_decrease >= latency:
+            self._last_decrease = now
+            self.limit = max(float(self.min_limit), self.limit * self.backoff)
+
+
+class AdmissionControlMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        default: AdaptiveLimiter,
+        routes: Sequence[tuple[tuple[str, ...], AdaptiveLimiter]] = (),
+        exempt_prefixes: tuple[str, ...] = (),
+        include_prefixes: tuple[str, ...] | None = None,
+        queue_timeout_ms: int = 500,
+        retry_after_seconds: int = 1,
+    ) -> None:
+        self.app = app
+        self.default = default
+        self.routes = routes
+        self.exempt_prefixes = exempt_prefixes
+        self.include_prefixes = include_prefixes
+        self.queue_timeout = queue_timeout_ms / 1000
+        self.retry_after = str(retry_after_seconds)
+
+    def limiter_for(self, path: str) -> AdaptiveLimiter | None:
+        if path.startswith(self.exempt_prefixes):
+            return None
+        if self.include_prefixes is not None and not path.startswith(self.include_prefixes):
+            return None
+        for prefixes, limiter in self.routes:
+            if path.startswith(prefixes):
+                return limiter
+        return self.default
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limiter = self.limiter_for(scope["path"]) if scope["type"] == "http" else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        timeout = self.queue_timeout
+        budget = remaining()
+        if budget is not None:
+            timeout = min(timeout, budget)
+        if not await limiter.acquire(timeout):
+            logger.warning("admission.rejected", limiter=limiter.name, path=scope["path"],
+                           limit=round(limiter.limit, 2), inflight=limiter.inflight)
+            response = JSONResponse(
+                {"detail": "Server is overloaded, retry later"},
+                status_code=503,
+                headers={"Retry-After": self.retry_after},
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        latency: float | None = None
+        try:
+            await self.app(scope, receive, send)
+            latency = time.perf_counter() - started
+        finally:
+            limiter.release(latency)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.caching import encoded_etag
+
+# Re-exported (import ... as) for the precompress CLI.
+try:
+    import brotli as brotli  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/problem+json",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def negotiate_encoding(accept_encoding: str, *, brotli_available: bool) -> str | None:
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    if brotli_available and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def _revalidated_etag(message: Message, encoding: str, request_headers: Headers) -> None:
+    # A 304 carries the validator the client holds; that is the compressed one
+    # when the cached 200 was compressed.
+    headers = MutableHeaders(raw=message["headers"])
+    etag = headers.get("etag")
+    if etag is not None and encoded_etag(etag, encoding) in request_headers.get(
+            "if-none-match", ""):
+        headers["ETag"] = encoded_etag(etag, encoding)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(
+            request_headers.get("accept-encoding", ""), brotli_available=brotli is not None)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if message["status"] == 304:
+                    _revalidated_etag(message, encoding, request_headers)
+                    await send(message)
+                    passthrough = True
+                    return
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                # Extension messages such as zero-copy sends carry the body themselves,
+                # so the held start goes out first and the response is left alone.
+                if start_message is not None:
+                    passthrough = True
+                    await send(start_message)
+                await send(message)
+                return
+
+            body: bytes = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            # Streamed, already-encoded, small or binary responses are sent untouched.
+            if (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or len(body) < self.minimum_size
+                or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = self._compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], encoding)
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br" and brotli is not None:
+            return bytes(brotli.compress(body, quality=self.brotli_quality))
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+
+from psycopg.errors import QueryCanceled
+from sqlalchemy.exc import DBAPIError
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.deadline import DeadlineExceeded, record_timeout, request_deadline, set_deadline
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEADLINE_HEADER = "x-request-timeout"
+
+
+class DeadlineMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        default_ms: int,
+        max_ms: int,
+        overrides: Mapping[str, int] | None = None,
+        include_prefixes: tuple[str, ...] | None = None,
+    ) -> None:
+        self.app = app
+        self.default_ms = default_ms
+        self.max_ms = max_ms
+        # Longest prefix first so the most specific override wins.
+        self.overrides = sorted((overrides or {}).items(), key=lambda item: -len(item[0]))
+        self.include_prefixes = include_prefixes
+
+    def budget_ms(self, scope: Scope) -> int:
+        header = Headers(scope=scope).get(DEADLINE_HEADER)
+        if header is not None:
+            try:
+                return max(1, min(int(header), self.max_ms))
+            except ValueError:
+                pass
+        for prefix, budget in self.overrides:
+            if scope["path"].startswith(prefix):
+                return budget
+        return self.default_ms
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (
+            self.include_prefixes is not None
+            and not scope["path"].startswith(self.include_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        budget = self.budget_ms(scope) / 1000
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        token = set_deadline(budget)
+        kind: str | None = None
+        try:
+            async with asyncio.timeout(budget):
+                await self.app(scope, receive, send_wrapper)
+        except DeadlineExceeded as exc:
+            kind = exc.kind
+        except TimeoutError:
+            kind = "request"
+        except DBAPIError as exc:
+            if not isinstance(exc.orig, QueryCanceled):
+                raise
+            kind = "db"
+        finally:
+            request_deadline.reset(token)
+
+        if kind is None:
+            return
+        record_timeout(kind)
+        logger.warning("request.timeout", kind=kind, path=scope["path"], budget_ms=budget * 1000)
+        if not response_started:
+            response = JSONResponse({"detail": "Request deadline exceeded"}, status_code=504)
+            await response(scope, receive, send)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import tracemalloc
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.diagnostics.memory import MemoryTracer
+from app.infrastructure.diagnostics.profiler import UNATTRIBUTED
+
+
+class MemoryTrackingMiddleware:
+    def __init__(self, app: ASGIApp, *, tracer: MemoryTracer) -> None:
+        self.app = app
+        self.tracer = tracer
+        self.in_flight = 0
+        self.started = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.tracer.tracing:
+            await self.app(scope, receive, send)
+            return
+
+        # tracemalloc has one process-wide peak, so it only belongs to a request
+        # that ran alone; overlapping requests still record their growth.
+        exclusive = self.in_flight == 0
+        self.in_flight += 1
+        self.started += 1
+        generation = self.started
+        if exclusive:
+            tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+            # Tracing may have hit a limit and stopped while the request ran.
+            if self.tracer.tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                exclusive = exclusive and self.started == generation
+                route = scope.get("route")
+                self.tracer.record_request(
+                    scope["method"],
+                    getattr(route, "path", UNATTRIBUTED),
+                    growth=current - before,
+                    peak=peak - before if exclusive else None,
+                )
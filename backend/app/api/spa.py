@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import mimetypes
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from app.api.caching import etag_matches
+from app.api.middleware.compression import negotiate_encoding
+
+# Vite emits content-hashed names such as assets/index-BXk2a9_c.js; files copied from
+# public/ (apple-touch-icon.png, ...) keep their names and must stay revalidated.
+HASHED_NAME = re.compile(r"^assets/(?:.+/)?[^/]+-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+@dataclass(frozen=True, slots=True)
+class StaticFile:
+    path: Path
+    stat: os.stat_result
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.stat.st_mtime_ns:x}-{self.stat.st_size:x}"'
+
+
+@dataclass(frozen=True, slots=True)
+class Asset:
+    file: StaticFile
+    media_type: str
+    immutable: bool
+    encoded: dict[str, StaticFile] = field(default_factory=dict)
+
+
+def build_asset_index(directory: Path) -> dict[str, Asset]:
+    index: dict[str, Asset] = {}
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file():
+            continue
+        # .br/.gz files next to their source are variants, not assets of their own.
+        if path.suffix in (".br", ".gz") and path.with_suffix("").is_file():
+            continue
+        encoded = {
+            encoding: StaticFile(variant, variant.stat())
+            for encoding, suffix in ENCODING_SUFFIXES.items()
+            if (variant := path.with_name(path.name + suffix)).is_file()
+        }
+        name = path.relative_to(directory).as_posix()
+        index[name] = Asset(
+            file=StaticFile(path, path.stat()),
+            media_type=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            immutable=HASHED_NAME.match(name) is not None,
+            encoded=encoded,
+        )
+    return index
+
+
+class SpaStaticFiles:
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        fallback: str = "index.html",
+        excluded_prefixes: tuple[str, ...] = ("api/",),
+        sendfile_min_size: int = 64 * 1024,
+    ) -> None:
+        self.directory = Path(directory)
+        self.index = build_asset_index(self.directory)
+        if fallback not in self.index:
+            msg = f"SPA fallback {fallback!r} not found in {self.directory}"
+            raise RuntimeError(msg)
+        self.fallback = fallback
+        self.excluded_prefixes = excluded_prefixes
+        self.sendfile_min_size = sendfile_min_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+        response = self._lookup(scope)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        asset = self._resolve(scope)
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""),
+                                      brotli_available="br" in asset.encoded)
+        file = asset.file
+        headers = {
+            "Cache-Control": (IMMUTABLE_CACHE_CONTROL if asset.immutable
+                              else REVALIDATE_CACHE_CONTROL),
+        }
+        if asset.encoded:
+            headers["Vary"] = "Accept-Encoding"
+        if encoding in asset.encoded:
+            file = asset.encoded[encoding]
+            headers["Content-Encoding"] = encoding
+        etag = headers["ETag"] = file.etag
+
+        if etag_matches(request_headers.get("if-none-match"), etag):
+            await Response(status_code=304, headers=headers)(scope, receive, send)
+            return
+        if (
+            ZEROCOPY_EXTENSION in scope.get("extensions", {})
+            and scope["method"] == "GET"
+            and "range" not in request_headers
+            and file.stat.st_size >= self.sendfile_min_size
+        ):
+            await self._zerocopy(send, file, asset.media_type, headers)
+            return
+        await FileResponse(file.path, headers=headers, media_type=asset.media_type,
+                           stat_result=file.stat)(scope, receive, send)
+
+    def _lookup(self, scope: Scope) -> Response | None:
+        if scope["method"] not in ("GET", "HEAD"):
+            return PlainTextResponse("Method Not Allowed", status_code=405,
+                                     headers={"Allow": "GET, HEAD"})
+        key = self._key(scope)
+        if key.startswith(self.excluded_prefixes) or f"{key}/" in self.excluded_prefixes:
+            return PlainTextResponse("Not Found", status_code=404)
+        # Unknown files are real 404s; only extensionless paths are client-side routes.
+        if key not in self.index and "." in key.rpartition("/")[2]:
+            return PlainTextResponse("Not Found", status_code=404)
+        return None
+
+    def _resolve(self, scope: Scope) -> Asset:
+        return self.index.get(self._key(scope)) or self.index[self.fallback]
+
+    def _key(self, scope: Scope) -> str:
+        path: str = scope["path"]
+        root_path: str = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        return path.lstrip("/")
+
+    async def _zerocopy(
+        self, send: Send, file: StaticFile, media_type: str, headers: dict[str, str]
+    ) -> None:
+        response = Response(headers=headers, media_type=media_type)
+        response.headers["content-length"] = str(file.stat.st_size)
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": response.raw_headers})
+        handle = await anyio.to_thread.run_sync(file.path.open, "rb")
+        try:
+            await send({"type": ZEROCOPY_EXTENSION, "file": handle,
+                        "count": file.stat.st_size, "more_body": False})
+        finally:
+            handle.close()
@@ -1,3 +1,3 @@
-from . import auth, health, users
+from . import audit, auth, diagnostics, health, users
 
-__all__ = ["auth", "health", "users"]
+__all__ = ["audit", "auth", "diagnostics", "health", "users"]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_superuser, get_session
+from app.infrastructure.db.repositories.auth_events import AuthEventRepository
+from app.schemas.audit import AuthEventRead
+
+
+router = APIRouter(dependencies=[Depends(get_current_superuser)])
+
+
+@router.get("/events", response_model=list[AuthEventRead])
+async def list_auth_events(
+    user_id: UUID | None = None,
+    event_type: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = Query(
+        default=None, description="Exclusive; pass the last occurred_at to page backwards"),
+    limit: int = Query(default=100, ge=1, le=1_000),
+    session: AsyncSession = Depends(get_session),
+) -> list[AuthEventRead]:
+    repo = AuthEventRepository(session)
+    events = await repo.list(
+        user_id=user_id, event_type=event_type, start=start, end=end, limit=limit)
+    return [AuthEventRead.model_validate(event) for event in events]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.deps import get_current_superuser
+from app.core.config import settings
+from app.core.deadline import timeout_counts
+from app.infrastructure.audit.events import auth_events
+from app.infrastructure.db.loaders import user_loader
+from app.infrastructure.db.session import engine, slow_query_log
+from app.infrastructure.diagnostics.loop_monitor import loop_monitor
+from app.infrastructure.diagnostics.memory import (
+    BASELINE,
+    GroupBy,
+    MemoryTracingError,
+    memory_tracer,
+)
+from app.infrastructure.diagnostics.profiler import StackSampler, profile_lock, route_index
+from app.infrastructure.warmup import warmup
+
+
+router = APIRouter(dependencies=[Depends(get_current_superuser)])
+
+
+@router.get("/loaders")
+async def loader_stats() -> dict[str, Any]:
+    return {"users": user_loader.stats()}
+
+
+@router.get("/admission")
+async def admission_stats(request: Request) -> dict[str, Any]:
+    return {limiter.name: limiter.snapshot() for limiter in request.app.state.admission_limiters}
+
+
+@router.get("/auth-events")
+async def auth_event_stats() -> dict[str, int]:
+    return auth_events.snapshot()
+
+
+@router.get("/db")
+async def db_stats() -> dict[str, Any]:
+    return {
+        "pool": engine.pool.status(),
+        "slow_query_threshold_ms": slow_query_log.threshold * 1000,
+        "slow_queries": slow_query_log.slow_queries,
+    }
+
+
+@router.get("/timeouts")
+async def timeout_stats() -> dict[str, int]:
+    return dict(timeout_counts)
+
+
+@router.get("/event-loop")
+async def event_loop_stats() -> dict[str, Any]:
+    return loop_monitor.snapshot()
+
+
+@router.get("/warmup")
+async def warmup_stats() -> dict[str, Any]:
+    return warmup.snapshot()
+
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile_worker(
+    request: Request,
+    seconds: float = Query(default=5, gt=0),
+    hz: int = Query(default=100, ge=1),
+) -> PlainTextResponse:
+    if seconds > settings.profiler_max_seconds or hz > settings.profiler_max_hz:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Profiles are limited to {settings.profiler_max_seconds}s "
+            f"at {settings.profiler_max_hz}Hz",
+        )
+    if not profile_lock.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="A profile is already running")
+    try:
+        sampler = StackSampler(
+            thread_id=threading.get_ident(),
+            hz=hz,
+            max_stacks=settings.profiler_max_stacks,
+            routes=route_index(request.app.routes),
+        )
+        profile = await asyncio.to_thread(sampler.run, seconds)
+    finally:
+        profile_lock.release()
+    return PlainTextResponse(
+        profile.collapsed(),
+        headers={
+            "X-Profile-Samples": str(profile.samples),
+            "X-Profile-Truncated": str(profile.truncated),
+        },
+    )
+
+
+@router.get("/memory")
+async def memory_stats() -> dict[str, Any]:
+    return memory_tracer.snapshot()
+
+
+@router.post("/memory/start")
+async def start_memory_trace(
+    seconds: int = Query(default=60, gt=0),
+    frames: int = Query(default=10, ge=1),
+) -> dict[str, Any]:
+    try:
+        memory_tracer.start(seconds=seconds, frames=frames)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except MemoryTracingError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    return memory_tracer.snapshot()
+
+
+@router.post("/memory/stop")
+async def stop_memory_trace() -> dict[str, Any]:
+    await memory_tracer.stop()
+    return memory_tracer.snapshot()
+
+
+@router.post("/memory/snapshots")
+async def take_memory_snapshot() -> dict[str, str]:
+    try:
+        return {"id": memory_tracer.take_snapshot()}
+    except MemoryTracingError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+
+
+@router.get("/memory/diff")
+async def memory_diff(
+    request: Request,
+    since: str = BASELINE,
+    group_by: GroupBy = "module",
+    limit: int = Query(default=20, ge=1, le=200),
+) -> list[dict[str, Any]]:
+    try:
+        # Comparing snapshots is pure Python; a worker thread lets the loop keep serving.
+        return await asyncio.to_thread(
+            memory_tracer.diff, since=since, group_by=group_by, limit=limit,
+            routes=list(request.app.routes))
+    except MemoryTracingError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    except KeyError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown snapshot {since!r}") from exc
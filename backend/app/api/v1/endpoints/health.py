@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
+
+from app.infrastructure.warmup import warmup
 
 
 router = APIRouter()
@@ -12,5 +14,8 @@ async def liveness() -> dict[str, str]:
 
 
 @router.get("/ready")
-async def readiness() -> dict[str, str]:
+async def readiness(response: Response) -> dict[str, str]:
+    if not warmup.ready.is_set():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "warming_up"}
     return {"status": "ready"}
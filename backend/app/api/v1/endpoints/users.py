@@ -1,29 +1,103 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import base64
+import json
+from typing import Any, Literal
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.caching import etag_matches, make_etag, not_modified, set_etag
 from app.api.deps import get_current_user, get_session
+from app.domain.models.user import User
 from app.infrastructure.db.repositories.users import UserRepository
-from app.schemas.user import UserRead
+from app.schemas.user import UserRead, UserSearchPage
 
 
 router = APIRouter()
 
+SearchMode = Literal["prefix", "fuzzy"]
+
+
+def _encode_cursor(mode: SearchMode, key: str | float, user_id: UUID) -> str:
+    raw = json.dumps([mode, key, str(user_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(mode: SearchMode, cursor: str) -> tuple[str | float, UUID]:
+    try:
+        cursor_mode, key, user_id = json.loads(base64.urlsafe_b64decode(cursor))
+        if cursor_mode != mode:
+            msg = "Cursor does not match search mode"
+            raise ValueError(msg)
+        return key, UUID(user_id)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
 
 @router.get("/me", response_model=UserRead)
-async def read_current_user(current_user: UserRead = Depends(get_current_user)) -> UserRead:
+async def read_current_user(
+    response: Response,
+    current_user: UserRead = Depends(get_current_user),
+    if_none_match: str | None = Header(default=None),
+) -> Any:
+    etag = make_etag(current_user.id, current_user.updated_at.isoformat())
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
     return current_user
 
 
+@router.get("/search", response_model=UserSearchPage)
+async def search_users(
+    q: str = Query(min_length=1, max_length=320),
+    mode: SearchMode = "prefix",
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = None,
+    current_user: UserRead = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+) -> UserSearchPage:
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges")
+    after = _decode_cursor(mode, cursor) if cursor else None
+    repo = UserRepository(session)
+    rows: list[tuple[User, str | float]]
+    if mode == "fuzzy":
+        fuzzy_after = (float(after[0]), after[1]) if after else None
+        rows = list(await repo.search_fuzzy(q, limit=limit + 1, after=fuzzy_after))
+    else:
+        prefix_after = (str(after[0]), after[1]) if after else None
+        rows = list(await repo.search_prefix(q, limit=limit + 1, after=prefix_after))
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_user, last_key = rows[-1]
+        next_cursor = _encode_cursor(mode, last_key, last_user.id)
+    return UserSearchPage(
+        items=[UserRead.model_validate(user) for user, _ in rows],
+        next_cursor=next_cursor,
+    )
+
+
 @router.get("", response_model=list[UserRead])
 async def list_users(
+    response: Response,
     current_user: UserRead = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
-) -> list[UserRead]:
+    if_none_match: str | None = Header(default=None),
+) -> Any:
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges")
     repo = UserRepository(session)
-    users = await repo.list()
-    return [UserRead.model_validate(user) for user in users]
+    count, last_updated_at = await repo.list_version()
+    etag = make_etag("users", count, last_updated_at.isoformat() if last_updated_at else "")
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    rows = await repo.list_read()
+    return [UserRead.model_construct(**row._mapping) for row in rows]
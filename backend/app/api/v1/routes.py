@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, health, users
+from app.api.v1.endpoints import audit, auth, diagnostics, health, users
 
 
 router = APIRouter()
@@ -10,3 +10,5 @@ router = APIRouter()
 router.include_router(health.router, prefix="/health", tags=["health"])
 router.include_router(auth.router, prefix="/auth", tags=["auth"])
 router.include_router(users.router, prefix="/users", tags=["users"])
+router.include_router(audit.router, prefix="/audit", tags=["audit"])
+router.include_router(diagnostics.router, prefix="/diagnostics", tags=["diagnostics"])
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from app.core.logging import configure_logging
+from app.infrastructure.db.session import SessionLocal, engine
+from app.services.user_import import ImportResult, UserImportService, read_csv, read_ndjson
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli.import_users",
+        description="Bulk import users from CSV or NDJSON "
+        "(columns: email, full_name, password or hashed_password).",
+    )
+    parser.add_argument("path", help="Input file, or '-' for stdin")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default=None,
+                        help="Input format (defaults to the file extension)")
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--hash-workers", type=int, default=None,
+                        help="Threads used for password hashing (defaults to CPU count)")
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> ImportResult:
+    fmt = args.format or ("ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv")
+    reader = read_ndjson if fmt == "ndjson" else read_csv
+    stream = sys.stdin if args.path == "-" else Path(args.path).open(newline="", encoding="utf-8")
+    try:
+        async with SessionLocal() as session:
+            service = UserImportService(
+                session, batch_size=args.batch_size, hash_workers=args.hash_workers)
+            return await service.import_users(reader(stream))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        await engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    configure_logging()
+    result = asyncio.run(_run(_parse_args(argv)))
+    print(f"copied={result.copied} inserted={result.inserted} skipped={result.skipped}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.infrastructure.db.migrations import LockRisk, find_lock_risks, split_script
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli.migration_preflight",
+        description="Render pending migrations as SQL and reject statements "
+        "likely to hold long table locks.",
+    )
+    parser.add_argument("--config", default="alembic.ini")
+    parser.add_argument("--from-revision", default=None,
+                        help="Start revision (defaults to the database's current revision)")
+    parser.add_argument("--to-revision", default="head")
+    return parser.parse_args(argv)
+
+
+def current_revision() -> str | None:
+    engine = create_engine(settings.sync_database_uri)
+    try:
+        with engine.connect() as connection:
+            return MigrationContext.configure(connection).get_current_revision()
+    finally:
+        engine.dispose()
+
+
+def pending_lock_risks(config_path: str, start: str | None, end: str) -> list[LockRisk]:
+    buffer = io.StringIO()
+    command.upgrade(Config(config_path, output_buffer=buffer),
+                    f"{start}:{end}" if start else end, sql=True)
+    return find_lock_risks(split_script(buffer.getvalue()))
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    start = args.from_revision or current_revision()
+    risks = pending_lock_risks(args.config, start, args.to_revision)
+    for risk in risks:
+        statement = " ".join(risk.statement.split())
+        print(f"[{risk.revision}] {risk.reason}\n    {statement[:200]}")
+    if risks:
+        sys.exit(1)
+    print(f"no lock risks in {start or 'base'}..{args.to_revision}")
+
+
+if __name__ == "__main__":
+    main()
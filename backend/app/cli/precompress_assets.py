@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+import mimetypes
+from pathlib import Path
+
+from app.api.middleware.compression import COMPRESSIBLE_TYPES, brotli
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli.precompress_assets",
+        description="Write .br and .gz variants next to compressible files of a built SPA.",
+    )
+    parser.add_argument("directory", help="Build output directory, e.g. frontend/dist")
+    parser.add_argument("--min-size", type=int, default=1024,
+                        help="Skip files smaller than this many bytes")
+    return parser.parse_args(argv)
+
+
+def _write_if_smaller(target: Path, original_size: int, data: bytes) -> bool:
+    if len(data) >= original_size:
+        target.unlink(missing_ok=True)
+        return False
+    target.write_bytes(data)
+    return True
+
+
+def precompress(directory: Path, *, min_size: int = 1024) -> tuple[int, int]:
+    gzipped = brotlied = 0
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file() or path.suffix in (".br", ".gz"):
+            continue
+        media_type = mimetypes.guess_type(path.name)[0] or ""
+        data = path.read_bytes()
+        if len(data) < min_size or not media_type.startswith(COMPRESSIBLE_TYPES):
+            continue
+        # Compressed once at build time, so spend the CPU on maximum ratios.
+        gzipped += _write_if_smaller(path.with_name(path.name + ".gz"), len(data),
+                                     gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli is not None:
+            brotlied += _write_if_smaller(path.with_name(path.name + ".br"), len(data),
+                                          bytes(brotli.compress(data, quality=11)))
+    return gzipped, brotlied
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    gzipped, brotlied = precompress(Path(args.directory), min_size=args.min_size)
+    print(f"gzip={gzipped} br={brotlied}")
+    if brotli is None:
+        print("brotli is not installed; install the 'compression' extra for .br variants")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Any
+from typing import Any, Literal
 from urllib.parse import quote_plus
 
 from pydantic import BaseModel, Field
@@ -34,7 +34,26 @@ class Settings(BaseSettings):
     database_password: str = "template"
     database_name: str = "template"
 
+    migration_lock_timeout_ms: int = 3_000
+    migration_lock_retries: int = 5
+    migration_retry_backoff_seconds: float = 2.0
+    migration_backfill_batch_size: int = 1_000
+    migration_backfill_pause_seconds: float = 0.1
+
+    slow_query_threshold_ms: int = 250
+    slow_query_explain_enabled: bool = False
+    slow_query_explain_interval_seconds: float = 60.0
+
     redis_url: str = "redis://redis:6379/0"
+    redis_mode: Literal["standalone", "cluster", "sentinel"] = "standalone"
+    redis_sentinels: list[str] = Field(default_factory=list)
+    redis_sentinel_service: str = "mymaster"
+    redis_sentinel_password: str | None = None
+    redis_max_connections: int = 50
+    redis_socket_timeout: float | None = 5.0
+    redis_socket_connect_timeout: float | None = 2.0
+    redis_health_check_interval: int = 30
+    redis_protocol: int = 2
 
     jwt_secret: str = Field(default="change-me", alias="JWT_SECRET")
     jwt_algorithm: str = Field(default="HS256", alias="JWT_ALGORITHM")
@@ -45,6 +64,25 @@ class Settings(BaseSettings):
 
     otlp_endpoint: str | None = Field(default=None, alias="OTLP_ENDPOINT")
 
+    warmup_enabled: bool = True
+    warmup_db_connections: int = 5
+    warmup_redis_connections: int = 5
+    warmup_hot_users: int = 0
+    warmup_timeout_seconds: float = 10.0
+
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval_ms: int = 100
+    loop_monitor_block_threshold_ms: int = 250
+
+    profiler_max_seconds: int = 30
+    profiler_max_hz: int = 250
+    profiler_max_stacks: int = 5_000
+
+    memory_trace_max_seconds: int = 300
+    memory_trace_max_frames: int = 25
+    memory_trace_max_overhead_mb: int = 64
+    memory_trace_max_snapshots: int = 4
+
     celery_broker_url: str = "redis://redis:6379/1"
     celery_result_backend: str = "redis://redis:6379/2"
 
@@ -52,6 +90,44 @@ class Settings(BaseSettings):
     smtp_port: int | None = None
     smtp_username: str | None = None
     smtp_password: str | None = None
+    smtp_sender: str = "no-reply@example.com"
+    smtp_use_tls: bool = False
+    smtp_timeout_seconds: float = 10.0
+    smtp_pool_size: int = 2
+
+    outbox_batch_size: int = 50
+    outbox_max_attempts: int = 8
+    outbox_retry_backoff_seconds: int = 30
+    outbox_poll_interval_seconds: float = 5.0
+
+    auth_events_buffer_size: int = 10_000
+    auth_events_batch_size: int = 500
+    auth_events_flush_interval_seconds: float = 1.0
+    auth_events_retention_days: int = 180
+    auth_events_partitions_ahead: int = 2
+
+    request_timeout_ms: int = 10_000
+    request_timeout_max_ms: int = 30_000
+    request_timeout_overrides: dict[str, int] = Field(
+        default_factory=lambda: {"/api/v1/diagnostics/profile": 65_000})
+
+    admission_enabled: bool = True
+    admission_queue_timeout_ms: int = 500
+    admission_max_queue: int = 200
+    admission_retry_after_seconds: int = 1
+    admission_default_limit: int = 64
+    admission_default_max_limit: int = 512
+    admission_default_target_latency_ms: int = 250
+    admission_expensive_limit: int = 8
+    admission_expensive_max_limit: int = 64
+    admission_expensive_target_latency_ms: int = 1_000
+
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+
+    spa_dist_dir: str | None = None
+    spa_sendfile_min_size: int = 65_536
 
     cors: CorsSettings = CorsSettings()
 
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+
+from opentelemetry import metrics
+
+meter = metrics.get_meter(__name__)
+_timeouts_counter = meter.create_counter(
+    "request.timeouts", description="Requests that ran out of their deadline, by layer")
+
+# Monotonic instant by which the current request must finish.
+request_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+timeout_counts: Counter[str] = Counter()
+
+
+class DeadlineExceeded(TimeoutError):
+    def __init__(self, kind: str) -> None:
+        super().__init__(f"Request deadline exceeded ({kind})")
+        self.kind = kind
+
+
+def set_deadline(seconds: float) -> Token[float | None]:
+    return request_deadline.set(time.monotonic() + seconds)
+
+
+def remaining() -> float | None:
+    deadline = request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def record_timeout(kind: str) -> None:
+    timeout_counts[kind] += 1
+    _timeouts_counter.add(1, {"kind": kind})
+
+
+@asynccontextmanager
+async def bounded(kind: str) -> AsyncIterator[None]:
+    budget = remaining()
+    if budget is not None and budget <= 0:
+        raise DeadlineExceeded(kind)
+    try:
+        async with asyncio.timeout(budget):
+            yield
+    except TimeoutError as exc:
+        if isinstance(exc, DeadlineExceeded):
+            raise
+        raise DeadlineExceeded(kind) from exc
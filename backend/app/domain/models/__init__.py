@@ -1,4 +1,6 @@
+from .auth_event import AuthEvent
+from .email_outbox import EmailOutbox
 from .refresh_token import RefreshToken
 from .user import User
 
-__all__ = ["User", "RefreshToken"]
+__all__ = ["User", "RefreshToken", "EmailOutbox", "AuthEvent"]
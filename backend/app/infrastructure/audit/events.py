@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import deque
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.db.repositories.auth_events import AuthEventRepository
+from app.infrastructure.db.session import SessionLocal
+
+logger = get_logger(__name__)
+
+
+# Request handlers only append to memory; a background task flushes batches to Postgres.
+class AuthEventBuffer:
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+    ) -> None:
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_seconds
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self._pending: deque[dict[str, Any]] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def record(self, event_type: str, *, user_id: UUID | None = None, **data: Any) -> None:
+        if len(self._pending) >= self.max_size:
+            self.dropped += 1
+            return
+        self._pending.append({
+            "id": uuid4(),
+            "occurred_at": datetime.now(UTC),
+            "event_type": event_type,
+            "user_id": user_id,
+            "data": {key: str(value) for key, value in data.items()},
+        })
+        self.recorded += 1
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="auth-event-flusher")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        while self._pending:
+            batch = [self._pending.popleft()
+                     for _ in range(min(self.batch_size, len(self._pending)))]
+            try:
+                async with SessionLocal() as session:
+                    await AuthEventRepository(session).insert_many(batch)
+                    await session.commit()
+            except Exception:  # noqa: BLE001 - auditing must never take the app down
+                self.dropped += len(batch)
+                logger.exception("auth_events.flush_failed", events=len(batch))
+                return
+            self.written += len(batch)
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            "pending": len(self._pending),
+            "recorded": self.recorded,
+            "written": self.written,
+            "dropped": self.dropped,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            self._wakeup.clear()
+            await self.flush()
+
+
+auth_events = AuthEventBuffer(
+    max_size=settings.auth_events_buffer_size,
+    batch_size=settings.auth_events_batch_size,
+    flush_interval_seconds=settings.auth_events_flush_interval_seconds,
+)
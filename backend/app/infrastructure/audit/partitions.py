@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+PARENT_TABLE = "auth_events"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_(\d{{4}})(\d{{2}})$")
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _month_start(month: date) -> datetime:
+    return datetime(month.year, month.month, 1, tzinfo=UTC)
+
+
+def ensure_partitions(connection: Connection, *, now: datetime, months_ahead: int) -> list[str]:
+    created = []
+    month = now.astimezone(UTC).date().replace(day=1)
+    for _ in range(months_ahead + 1):
+        upper = _next_month(month)
+        name = f"{PARENT_TABLE}_{month:%Y%m}"
+        exists = connection.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}).scalar_one()
+        if not exists:
+            # Rows that landed in the default partition while this month was missing would
+            # make CREATE ... PARTITION OF fail, so they are moved into a standalone table
+            # which is then attached.
+            connection.exec_driver_sql(
+                f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS)")
+            connection.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                    "WHERE occurred_at >= :lower AND occurred_at < :upper RETURNING *) "
+                    f"INSERT INTO {name} SELECT * FROM moved"
+                ),
+                {"lower": _month_start(month), "upper": _month_start(upper)},
+            )
+            connection.exec_driver_sql(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') "
+                f"TO ('{upper.isoformat()} 00:00+00')"
+            )
+            created.append(name)
+        month = upper
+    return created
+
+
+def drop_expired_partitions(
+    connection: Connection, *, now: datetime, retention_days: int
+) -> list[str]:
+    cutoff = (now - timedelta(days=retention_days)).astimezone(UTC).date()
+    partitions = connection.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent"
+        ),
+        {"parent": PARENT_TABLE},
+    ).scalars()
+    dropped = []
+    for name in list(partitions):
+        match = _PARTITION_NAME.match(name)
+        if match is None:
+            continue
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        # Whole partitions only: drop once every row in it is past retention.
+        if _next_month(month) <= cutoff:
+            connection.exec_driver_sql(f"DROP TABLE {name}")
+            dropped.append(name)
+    # Same whole-month boundary for rows that fell into the default partition.
+    connection.execute(
+        text(f"DELETE FROM {DEFAULT_PARTITION} WHERE occurred_at < :cutoff"),
+        {"cutoff": _month_start(cutoff)},
+    )
+    return dropped
@@ -1,6 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import queue
+import smtplib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+from email.utils import make_msgid
+
+
+def render_welcome_email(*, full_name: str | None) -> tuple[str, str]:
+    greeting = f"Hi {full_name}," if full_name else "Hi,"
+    body = f"{greeting}\n\nYour account is ready. Welcome aboard!\n"
+    return "Welcome!", body
 
 
 @dataclass
@@ -9,7 +21,83 @@ class EmailProvider:
     port: int
     username: str | None = None
     password: str | None = None
+    sender: str = "no-reply@example.com"
+    use_tls: bool = False
+    timeout: float = 10.0
+    pool_size: int = 2
+    _pool: queue.LifoQueue[smtplib.SMTP] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._pool = queue.LifoQueue(maxsize=self.pool_size)
+
+    def build_message(
+        self, *, to_email: str, subject: str, body: str, message_key: str | None = None
+    ) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = to_email
+        message["Subject"] = subject
+        # A stable Message-ID lets receivers drop duplicates of a retried delivery.
+        domain = self.sender.rpartition("@")[2] or None
+        message["Message-ID"] = (f"<{message_key}@{domain or 'localhost'}>"
+                                 if message_key else make_msgid(domain=domain))
+        message.set_content(body)
+        return message
+
+    def send(self, message: EmailMessage) -> None:
+        with self.connection() as smtp:
+            smtp.send_message(message)
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        smtp = self._checkout()
+        try:
+            yield smtp
+        except (smtplib.SMTPServerDisconnected, OSError):
+            self._discard(smtp)
+            raise
+        except BaseException:
+            self._checkin(smtp)
+            raise
+        self._checkin(smtp)
+
+    def close(self) -> None:
+        while True:
+            try:
+                smtp = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(smtp)
+
+    def _checkout(self) -> smtplib.SMTP:
+        while True:
+            try:
+                smtp = self._pool.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            try:
+                if smtp.noop()[0] == 250:
+                    return smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard(smtp)
+
+    def _checkin(self, smtp: smtplib.SMTP) -> None:
+        try:
+            self._pool.put_nowait(smtp)
+        except queue.Full:
+            self._discard(smtp)
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            smtp.starttls()
+        if self.username:
+            smtp.login(self.username, self.password or "")
+        return smtp
 
-    async def send_welcome_email(self, *, to_email: str) -> None:
-        # Placeholder implementation for template consumers to extend.
-        return None
+    def _discard(self, smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from base64 import urlsafe_b64encode
+from uuid import UUID
+
+ACCESS_TOKEN_PREFIX = b"a:"
+# Trailing id bytes are random for both uuid4 and time-ordered ids, so tags spread evenly.
+USER_TAG_BYTES = 3
+
+
+# Redis Cluster hashes only the text between the first braces, so every key
+# built from the same user tag lands in the same slot. base64url never emits braces.
+def user_hash_tag(user_id: UUID) -> bytes:
+    return b"{" + urlsafe_b64encode(user_id.bytes[-USER_TAG_BYTES:]) + b"}"
+
+
+# Keys hold the raw 16-byte jti; the value is empty because only existence is checked.
+def access_token_key(user_id: UUID, token_id: UUID) -> bytes:
+    return ACCESS_TOKEN_PREFIX + user_hash_tag(user_id) + token_id.bytes
+
+
+# Layout used before the compact keys; read only until tokens issued under it expire.
+def legacy_access_token_key(token_id: UUID) -> str:
+    return f"access:{token_id}"
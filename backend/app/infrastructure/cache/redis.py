@@ -1,18 +1,76 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Any, Protocol, cast
 
 from redis.asyncio import Redis
+from redis.asyncio.cluster import RedisCluster
+from redis.asyncio.connection import parse_url
+from redis.asyncio.sentinel import Sentinel
 
 from app.core.config import settings
 
 
+# The commands the application issues, common to every deployment mode. types-redis
+# lags redis-py here (no aclose, no cluster commands), so clients are cast to it.
+class RedisClient(Protocol):
+    async def exists(self, *names: bytes | str) -> int: ...
+
+    async def set(self, name: bytes | str, value: bytes | str, *, ex: int | None = None) -> Any: ...
+
+    async def ping(self) -> Any: ...
+
+    async def aclose(self) -> None: ...
+
+
+def _connection_kwargs() -> dict[str, Any]:
+    return {
+        "socket_timeout": settings.redis_socket_timeout,
+        "socket_connect_timeout": settings.redis_socket_connect_timeout,
+        "health_check_interval": settings.redis_health_check_interval,
+        "protocol": settings.redis_protocol,
+    }
+
+
+def _sentinel_address(address: str) -> tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host, int(port)
+
+
 @lru_cache(1)
-def _client() -> Redis:
-    return Redis.from_url(settings.redis_url, decode_responses=True)
+def _client() -> RedisClient:
+    if settings.redis_mode == "cluster":
+        # redis_url is only a seed node; the topology is discovered from it.
+        # max_connections applies per node here.
+        cluster: RedisCluster[bytes] = RedisCluster.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+            **_connection_kwargs(),
+        )
+        return cast(RedisClient, cluster)
+    if settings.redis_mode == "sentinel":
+        # Host and port come from the sentinels; db and credentials from redis_url.
+        url_kwargs: dict[str, Any] = {key: value for key, value in parse_url(settings.redis_url).items()
+                      if key in ("db", "username", "password")}
+        sentinel = Sentinel(
+            [_sentinel_address(address) for address in settings.redis_sentinels],
+            sentinel_kwargs={"socket_timeout": settings.redis_socket_timeout,
+                             "password": settings.redis_sentinel_password or None},
+            **_connection_kwargs(),
+            **url_kwargs,
+        )
+        master: Redis[bytes] = sentinel.master_for(
+            settings.redis_sentinel_service, max_connections=settings.redis_max_connections)
+        return cast(RedisClient, master)
+    client: Redis[bytes] = Redis.from_url(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        **_connection_kwargs(),
+    )
+    return cast(RedisClient, client)
 
 
-async def get_redis_client() -> Redis:
+async def get_redis_client() -> RedisClient:
     return _client()
 
 
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable, Mapping, Sequence
+from contextvars import copy_context
+from typing import Generic, TypeVar
+from uuid import UUID
+
+from psycopg.errors import QueryCanceled
+from sqlalchemy.exc import DBAPIError
+
+from app.core.deadline import request_deadline
+from app.infrastructure.db.repositories.users import UserRepository
+from app.infrastructure.db.session import SessionLocal
+from app.schemas.user import UserRead
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+# Coalesces concurrent calls for the same key into one in-flight future.
+class SingleFlight(Generic[K, V]):
+    def __init__(self) -> None:
+        self._inflight: dict[K, asyncio.Future[V]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        # Shield so one cancelled caller does not cancel the work for everyone else.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Future[V]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every caller went away
+
+
+def _latest(first: float | None, second: float | None) -> float | None:
+    # A waiter without a deadline leaves the whole batch unbounded.
+    if first is None or second is None:
+        return None
+    return max(first, second)
+
+
+def _outlives(deadline: float | None, batch_deadline: float | None) -> bool:
+    if batch_deadline is None:
+        return False
+    if deadline is None:
+        return True
+    return batch_deadline < deadline and time.monotonic() < deadline
+
+
+def _is_deadline_failure(exc: Exception) -> bool:
+    return isinstance(exc, TimeoutError) or (
+        isinstance(exc, DBAPIError) and isinstance(exc.orig, QueryCanceled))
+
+
+# Delivered to the waiters of a batch that ran out of its deadline, so a waiter that
+# joined the batch after dispatch with a later deadline of its own can load again.
+class _BatchDeadlineExceeded(Exception):
+    def __init__(self, error: Exception, deadline: float | None) -> None:
+        super().__init__(str(error))
+        self.error = error
+        self.deadline = deadline
+
+
+# Gathers the keys requested within one event-loop tick into a single batch call.
+class BatchLoader(Generic[K, V]):
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        *,
+        max_batch_size: int = 100,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._single_flight: SingleFlight[K, V | None] = SingleFlight()
+        self._queue: dict[K, asyncio.Future[V | None]] = {}
+        self._queue_deadline: float | None = None
+        self._scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.batches = 0
+        self.batched_keys = 0
+
+    async def load(self, key: K) -> V | None:
+        while True:
+            if key in self._queue:
+                # Coalescing onto a queued key; the batch must also run long enough for us.
+                self._queue_deadline = _latest(self._queue_deadline, request_deadline.get())
+            try:
+                return await self._single_flight.do(key, lambda: self._enqueue(key))
+            except _BatchDeadlineExceeded as exc:
+                # A dispatched batch keeps the deadline it started with; when that was
+                # shorter than ours, its failure is not ours and the key is loaded again.
+                if not _outlives(request_deadline.get(), exc.deadline):
+                    raise exc.error from None
+
+    async def load_many(self, keys: Sequence[K]) -> list[V | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "calls": self._single_flight.calls,
+            "coalesced": self._single_flight.coalesced,
+            "batches": self.batches,
+            "batched_keys": self.batched_keys,
+        }
+
+    def _enqueue(self, key: K) -> asyncio.Future[V | None]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[V | None] = loop.create_future()
+        deadline = request_deadline.get()
+        self._queue_deadline = (
+            _latest(self._queue_deadline, deadline) if self._queue else deadline)
+        self._queue[key] = future
+        if len(self._queue) >= self._max_batch_size:
+            self._dispatch()
+        elif not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        self._scheduled = False
+        if not self._queue:
+            return
+        batch, self._queue = self._queue, {}
+        self.batches += 1
+        self.batched_keys += len(batch)
+        # The batch serves several requests, so it must not inherit the deadline of
+        # whichever one queued first; it gets the latest deadline among its waiters.
+        context = copy_context()
+        context.run(request_deadline.set, self._queue_deadline)
+        task = asyncio.get_running_loop().create_task(self._run(batch), context=context)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[K, asyncio.Future[V | None]]) -> None:
+        try:
+            results = await self._batch_fn(list(batch))
+        except Exception as exc:  # noqa: BLE001 - delivered to every waiter
+            error = exc
+            if _is_deadline_failure(exc):
+                error = _BatchDeadlineExceeded(exc, request_deadline.get())
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+
+async def _load_users(user_ids: list[UUID]) -> dict[UUID, UserRead]:
+    async with SessionLocal() as session:
+        rows = await UserRepository(session).get_many_read(user_ids)
+    # Rows come straight from the users table, so validation is skipped.
+    return {row.id: UserRead.model_construct(**row._mapping) for row in rows}
+
+
+# Per-worker loader. Results are shared between concurrent callers and must not be mutated.
+user_loader: BatchLoader[UUID, UserRead] = BatchLoader(_load_users)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from alembic import context, op
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+LOCK_NOT_AVAILABLE = "55P03"
+# Marks a statement as reviewed for lock impact so the checker lets it through.
+LOCK_RISK_ALLOWED = "/* lock-risk: allowed */"
+
+_NAME = r'((?:"[^"]+"|\w+)(?:\.(?:"[^"]+"|\w+))?)'
+_CREATE_TABLE = re.compile(rf"^CREATE (?:UNLOGGED )?TABLE (?:IF NOT EXISTS )?{_NAME}", re.I)
+_CREATE_INDEX = re.compile(
+    rf"^CREATE (?:UNIQUE )?INDEX (CONCURRENTLY )?.*? ON (?:ONLY )?{_NAME}", re.I)
+_ALTER_TABLE = re.compile(rf"^ALTER TABLE (?:IF EXISTS )?(?:ONLY )?{_NAME} (.*)$", re.I)
+_UNBOUNDED_WRITE = re.compile(rf"^(?:UPDATE (?:ONLY )?|DELETE FROM (?:ONLY )?){_NAME}", re.I)
+_ALTER_RULES = (
+    (re.compile(r"\bALTER COLUMN \S+ (?:SET DATA )?TYPE\b", re.I),
+     "changing a column type rewrites the table under ACCESS EXCLUSIVE"),
+    (re.compile(r"\bSET NOT NULL\b", re.I),
+     "SET NOT NULL scans the table under ACCESS EXCLUSIVE; add a NOT VALID "
+     "CHECK constraint and validate it first"),
+    (re.compile(r"\bADD (?:CONSTRAINT \S+ )?(?:FOREIGN KEY|CHECK)\b(?!.*\bNOT VALID\b)", re.I),
+     "the new constraint is validated while holding the lock; add it NOT VALID "
+     "and VALIDATE CONSTRAINT in a later step"),
+    (re.compile(r"\bADD (?:CONSTRAINT \S+ )?(?:UNIQUE|PRIMARY KEY)\b(?!.*\bUSING INDEX\b)", re.I),
+     "the backing index is built while holding the lock; build it with "
+     "create_index_concurrently() and attach it USING INDEX"),
+    (re.compile(r"\bADD (?:COLUMN )?.*\b(?:DEFAULT (?:gen_random_uuid|uuid_generate_v4|random|"
+                r"clock_timestamp)\(|GENERATED ALWAYS AS .* STORED|\b(?:BIG|SMALL)?SERIAL\b)",
+                re.I),
+     "a volatile or generated column default rewrites the table"),
+)
+_STATEMENT_RULES = (
+    (re.compile(r"^DROP INDEX (?!CONCURRENTLY\b)", re.I),
+     "DROP INDEX blocks reads and writes; use drop_index_concurrently()"),
+    (re.compile(r"^REINDEX (?!.*\bCONCURRENTLY\b)", re.I),
+     "REINDEX blocks writes; use REINDEX ... CONCURRENTLY"),
+    (re.compile(r"^(?:VACUUM FULL|CLUSTER|LOCK)\b", re.I),
+     "takes an ACCESS EXCLUSIVE lock for the duration of the operation"),
+)
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_RUNNING_UPGRADE = re.compile(r"^-- Running upgrade .*?-> (\S+)", re.M)
+
+
+class LockRiskError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class LockRisk:
+    statement: str
+    reason: str
+    revision: str | None = None
+
+
+def _table(name: str) -> str:
+    return name.rpartition(".")[2].strip('"').lower()
+
+
+class LockRiskChecker:
+    def __init__(self) -> None:
+        # Tables created by the migrations being checked are empty, so any DDL on them is cheap.
+        self.created_tables: set[str] = set()
+
+    def check(self, statement: str) -> str | None:
+        if LOCK_RISK_ALLOWED in statement:
+            return None
+        sql = " ".join(_COMMENT.sub(" ", statement).split())
+        if match := _CREATE_TABLE.match(sql):
+            self.created_tables.add(_table(match.group(1)))
+            return None
+        if match := _CREATE_INDEX.match(sql):
+            if match.group(1) or _table(match.group(2)) in self.created_tables:
+                return None
+            return "CREATE INDEX blocks writes for the whole build; use create_index_concurrently()"
+        if match := _ALTER_TABLE.match(sql):
+            if _table(match.group(1)) in self.created_tables:
+                return None
+            for pattern, reason in _ALTER_RULES:
+                if pattern.search(match.group(2)):
+                    return reason
+            return None
+        if (match := _UNBOUNDED_WRITE.match(sql)) and not re.search(r"\bWHERE\b", sql, re.I):
+            if _table(match.group(1)) not in self.created_tables:
+                return "unbounded UPDATE/DELETE locks every row at once; use backfill_in_batches()"
+        for pattern, reason in _STATEMENT_RULES:
+            if pattern.match(sql):
+                return reason
+        return None
+
+    def guard(self, conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        if reason := self.check(statement):
+            raise LockRiskError(f"{reason}: {' '.join(statement.split())[:200]}")
+
+
+def split_script(script: str) -> Iterator[tuple[str | None, str]]:
+    revision = None
+    for chunk in re.split(r";\s*$", script, flags=re.M):
+        for match in _RUNNING_UPGRADE.finditer(chunk):
+            revision = match.group(1)
+        statement = _COMMENT.sub("", chunk).strip()
+        if statement:
+            yield revision, statement
+
+
+def find_lock_risks(statements: Iterable[tuple[str | None, str]]) -> list[LockRisk]:
+    checker = LockRiskChecker()
+    return [
+        LockRisk(statement=statement, reason=reason, revision=revision)
+        for revision, statement in statements
+        if (reason := checker.check(statement))
+    ]
+
+
+def is_lock_timeout(exc: BaseException) -> bool:
+    return (isinstance(exc, DBAPIError)
+            and getattr(exc.orig, "sqlstate", None) == LOCK_NOT_AVAILABLE)
+
+
+def create_index_concurrently(
+    index_name: str, table_name: str, columns: Sequence[str], **kw: Any
+) -> None:
+    with op.get_context().autocommit_block():
+        if context.is_offline_mode():
+            op.create_index(index_name, table_name, list(columns),
+                            postgresql_concurrently=True, if_not_exists=True, **kw)
+            return
+        bind = op.get_bind()
+        # A failed concurrent build leaves an INVALID index behind that
+        # IF NOT EXISTS would silently keep.
+        invalid = bind.execute(
+            text("SELECT 1 FROM pg_index WHERE NOT indisvalid "
+                 "AND indexrelid = to_regclass(:name)"), {"name": index_name}).first()
+        if invalid is not None:
+            op.drop_index(index_name, table_name=table_name,
+                          postgresql_concurrently=True, if_exists=True)
+        # The build only holds SHARE UPDATE EXCLUSIVE, which does not block reads or
+        # writes, so it may wait out older transactions instead of timing out.
+        lock_timeout = bind.execute(text("SHOW lock_timeout")).scalar_one()
+        bind.exec_driver_sql("SET lock_timeout = 0")
+        try:
+            op.create_index(index_name, table_name, list(columns),
+                            postgresql_concurrently=True, if_not_exists=True, **kw)
+        finally:
+            bind.execute(text("SELECT set_config('lock_timeout', :value, false)"),
+                         {"value": lock_timeout})
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(index_name, table_name=table_name,
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def backfill_in_batches(
+    table_name: str,
+    *,
+    set_clause: str,
+    pending: str,
+    key: str = "id",
+    batch_size: int | None = None,
+    pause_seconds: float | None = None,
+) -> int:
+    # ``pending`` must stop matching a row once it is backfilled, or this never ends.
+    batch_size = batch_size or settings.migration_backfill_batch_size
+    pause = settings.migration_backfill_pause_seconds if pause_seconds is None else pause_seconds
+    if context.is_offline_mode():
+        op.execute(f"-- batched backfill of {table_name}: SET {set_clause} WHERE {pending}")
+        return 0
+    statement = text(
+        f"UPDATE {table_name} SET {set_clause} WHERE {key} IN "
+        f"(SELECT {key} FROM {table_name} WHERE {pending} LIMIT :batch_size)"
+    )
+    total = 0
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        # Every batch commits on its own, so row locks are held only briefly.
+        while updated := bind.execute(statement, {"batch_size": batch_size}).rowcount:
+            total += updated
+            logger.info("migration.backfill", table=table_name, updated=updated, total=total)
+            time.sleep(pause)
+    return total
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.auth_event import AuthEvent
+from app.infrastructure.db.slow_query import track_repository_calls
+
+
+@track_repository_calls
+class AuthEventRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def insert_many(self, events: Sequence[dict[str, Any]]) -> None:
+        # One multi-row INSERT per batch.
+        await self.session.execute(insert(AuthEvent).values(list(events)))
+
+    async def list(
+        self,
+        *,
+        user_id: UUID | None = None,
+        event_type: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int = 100,
+    ) -> Sequence[AuthEvent]:
+        stmt = select(AuthEvent)
+        if user_id is not None:
+            stmt = stmt.where(AuthEvent.user_id == user_id)
+        if event_type is not None:
+            stmt = stmt.where(AuthEvent.event_type == event_type)
+        if start is not None:
+            stmt = stmt.where(AuthEvent.occurred_at >= start)
+        if end is not None:
+            stmt = stmt.where(AuthEvent.occurred_at < end)
+        stmt = stmt.order_by(AuthEvent.occurred_at.desc(), AuthEvent.id).limit(limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
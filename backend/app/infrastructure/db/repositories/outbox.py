@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.email_outbox import EmailOutbox
+from app.infrastructure.db.slow_query import track_repository_calls
+
+
+@track_repository_calls
+class OutboxRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def enqueue(
+        self, *, idempotency_key: str, recipient: str, subject: str, body: str
+    ) -> None:
+        stmt = (
+            insert(EmailOutbox)
+            .values(idempotency_key=idempotency_key, recipient=recipient,
+                    subject=subject, body=body)
+            .on_conflict_do_nothing(index_elements=[EmailOutbox.idempotency_key])
+        )
+        await self.session.execute(stmt)
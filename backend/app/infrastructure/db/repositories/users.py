@@ -1,16 +1,47 @@
 from __future__ import annotations
 
+import builtins
+from collections.abc import AsyncIterable
 from datetime import UTC, datetime
-from typing import Sequence
+from typing import Any, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Float,
+    Row,
+    and_,
+    any_,
+    bindparam,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.models.refresh_token import RefreshToken
 from app.domain.models.user import User
+from app.infrastructure.db.slow_query import track_repository_calls
 
+# Columns backing UserRead. Selecting them directly skips identity-map and
+# unit-of-work bookkeeping and never loads hashed_password.
+USER_READ_COLUMNS = (
+    User.id,
+    User.email,
+    User.full_name,
+    User.is_active,
+    User.is_superuser,
+    User.created_at,
+    User.updated_at,
+)
 
+
+@track_repository_calls
 class UserRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -19,6 +50,12 @@ class UserRepository:
         result = await self.session.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
 
+    async def get_many_read(self, user_ids: Sequence[UUID]) -> Sequence[Row[Any]]:
+        ids = bindparam("user_ids", list(user_ids), type_=ARRAY(PGUUID(as_uuid=True)))
+        result = await self.session.execute(
+            select(*USER_READ_COLUMNS).where(User.id == any_(ids)))
+        return result.all()
+
     async def get_by_email(self, email: str) -> User | None:
         result = await self.session.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none()
@@ -27,12 +64,105 @@ class UserRepository:
         result = await self.session.execute(select(User).order_by(User.created_at.desc()))
         return result.scalars().all()
 
-    async def create(self, *, email: str, hashed_password: str, full_name: str | None = None) -> User:
-        user = User(email=email, hashed_password=hashed_password,
-                    full_name=full_name)
-        self.session.add(user)
-        await self.session.flush()
-        return user
+    async def list_read(self) -> Sequence[Row[Any]]:
+        result = await self.session.execute(
+            select(*USER_READ_COLUMNS).order_by(User.created_at.desc()))
+        return result.all()
+
+    async def recently_active_ids(self, limit: int) -> Sequence[UUID]:
+        result = await self.session.execute(
+            select(User.id)
+            .where(User.is_active, User.last_login_at.is_not(None))
+            .order_by(User.last_login_at.desc())
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def list_version(self) -> tuple[int, datetime | None]:
+        result = await self.session.execute(select(func.count(), func.max(User.updated_at)))
+        count, last_updated_at = result.one()
+        return count, last_updated_at
+
+    async def search_prefix(
+        self, query: str, *, limit: int, after: tuple[str, UUID] | None = None
+    ) -> builtins.list[tuple[User, str]]:
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"{escaped}%"
+        stmt = select(User).where(
+            or_(User.email.ilike(pattern, escape="\\"),
+                User.full_name.ilike(pattern, escape="\\"))
+        )
+        if after is not None:
+            after_email, after_id = after
+            stmt = stmt.where(tuple_(User.email, User.id) > tuple_(
+                literal(after_email, User.email.type), literal(after_id, User.id.type)))
+        result = await self.session.execute(stmt.order_by(User.email, User.id).limit(limit))
+        return [(user, user.email) for user in result.scalars()]
+
+    async def search_fuzzy(
+        self, query: str, *, limit: int, after: tuple[float, UUID] | None = None
+    ) -> builtins.list[tuple[User, float]]:
+        # similarity() returns real; a float4 score would not round-trip through the
+        # float8 cursor, so ties with the cursor row would be skipped on the next page.
+        score = cast(func.greatest(
+            func.similarity(User.email, query),
+            func.coalesce(func.similarity(User.full_name, query), 0),
+        ), Float(53))
+        stmt = select(User, score.label("score")).where(
+            or_(User.email.op("%")(query), User.full_name.op("%")(query))
+        )
+        if after is not None:
+            after_score, after_id = after
+            stmt = stmt.where(or_(score < after_score,
+                                  and_(score == after_score, User.id > after_id)))
+        result = await self.session.execute(stmt.order_by(score.desc(), User.id).limit(limit))
+        return [(user, float(row_score)) for user, row_score in result.tuples()]
+
+    async def create(
+        self, *, email: str, hashed_password: str, full_name: str | None = None
+    ) -> User | None:
+        stmt = (
+            insert(User)
+            .values(email=email, hashed_password=hashed_password, full_name=full_name)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def copy_users(
+        self, batches: AsyncIterable[builtins.list[tuple[UUID, str, str, str | None]]]
+    ) -> tuple[int, int]:
+        # Stage rows with COPY, then merge so existing emails are skipped.
+        await self.session.execute(
+            text(
+                "CREATE TEMP TABLE users_import ("
+                "id uuid, email varchar(320), hashed_password varchar(255), "
+                "full_name varchar(255)) ON COMMIT DROP"
+            )
+        )
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        copied = 0
+        async with driver_connection.cursor() as cursor:  # type: ignore[union-attr]
+            async with cursor.copy(
+                "COPY users_import (id, email, hashed_password, full_name) FROM STDIN"
+            ) as copy:
+                async for batch in batches:
+                    for row in batch:
+                        await copy.write_row(row)
+                    copied += len(batch)
+
+        result = await self.session.execute(
+            text(
+                "INSERT INTO users (id, email, hashed_password, full_name) "
+                "SELECT id, email, hashed_password, full_name FROM users_import "
+                "ON CONFLICT (email) DO NOTHING"
+            )
+        )
+        return copied, result.rowcount  # type: ignore[attr-defined]
 
     async def save_refresh_token(
         self,
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
 
 from app.core.config import settings
+from app.core.deadline import DeadlineExceeded, remaining
+from app.infrastructure.db.slow_query import install_slow_query_log
 
 
 def get_engine() -> AsyncEngine:
@@ -12,9 +18,37 @@ def get_engine() -> AsyncEngine:
 
 
 engine: AsyncEngine = get_engine()
-SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
+slow_query_log = install_slow_query_log(engine)
+
+
+class DeadlineSession(Session):
+    pass
+
+
+@event.listens_for(DeadlineSession, "after_begin")
+def _apply_statement_timeout(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    # Bound every statement in the transaction by what is left of the request deadline.
+    budget = remaining()
+    if budget is None:
+        return
+    if budget <= 0:
+        raise DeadlineExceeded("db")
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {max(1, int(budget * 1000))}")
+
+
+SessionLocal = async_sessionmaker(
+    bind=engine, expire_on_commit=False, sync_session_class=DeadlineSession)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
         yield session
+
+
+# Synchronous sessions for Celery workers, created on first use.
+@lru_cache(1)
+def get_sync_sessionmaker() -> sessionmaker[Session]:
+    sync_engine = create_engine(settings.sync_database_uri, pool_pre_ping=True)
+    return sessionmaker(bind=sync_engine, expire_on_commit=False)
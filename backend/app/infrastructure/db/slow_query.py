@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import re
+import time
+from collections.abc import Callable, Mapping, Sequence
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T", bound=type)
+
+LOG_OPTION = "slow_query_log"
+_WHITESPACE = re.compile(r"\s+")
+_MAX_SQL_LENGTH = 2_000
+# Row-locking clauses in any form or line layout, and SELECT ... INTO (creates a table).
+_LOCKING_OR_WRITING = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b|\bINTO\b")
+
+# SQLAlchemy runs async statements in greenlets that inherit the caller's context,
+# so the repository method that issued a statement is visible from engine events.
+current_repository_method: ContextVar[str | None] = ContextVar(
+    "current_repository_method", default=None)
+
+
+def track_repository_calls(cls: T) -> T:
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(member):
+            continue
+        setattr(cls, name, _tracked(f"{cls.__name__}.{name}", member))
+    return cls
+
+
+def _tracked(label: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = current_repository_method.set(label)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            current_repository_method.reset(token)
+
+    return wrapper
+
+
+def normalize_sql(statement: str) -> str:
+    return _WHITESPACE.sub(" ", statement).strip()[:_MAX_SQL_LENGTH]
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    if parameters is None:
+        return None
+    if executemany and isinstance(parameters, Sequence) and parameters:
+        return {"rows": len(parameters), "row": parameter_shape(parameters[0])}
+    if isinstance(parameters, Mapping):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, Sequence) and not isinstance(parameters, str | bytes):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _explainable(statement: str) -> bool:
+    head = statement.lstrip().upper()
+    # EXPLAIN ANALYZE executes the statement, so only plain reads are safe to replay.
+    return head.startswith("SELECT") and _LOCKING_OR_WRITING.search(head) is None
+
+
+class SlowQueryLog:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        threshold_ms: int,
+        explain: bool,
+        explain_interval_seconds: float,
+    ) -> None:
+        self.engine = engine
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.explain_interval = explain_interval_seconds
+        self.slow_queries = 0
+        self._next_explain_at = 0.0
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def install(self) -> None:
+        sync_engine = self.engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        if context is not None:
+            context._slow_query_started_at = time.perf_counter()  # type: ignore[attr-defined]
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        started_at = getattr(context, "_slow_query_started_at", None)
+        if started_at is None:
+            return
+        elapsed = time.perf_counter() - started_at
+        if elapsed < self.threshold or not conn.get_execution_options().get(LOG_OPTION, True):
+            return
+        self.slow_queries += 1
+        sql = normalize_sql(statement)
+        logger.warning(
+            "db.slow_query",
+            duration_ms=round(elapsed * 1000, 2),
+            sql=sql,
+            parameters=parameter_shape(parameters, executemany),
+            repository_method=current_repository_method.get(),
+        )
+        if self.explain and not executemany and _explainable(statement):
+            self._maybe_explain(statement, parameters, sql)
+
+    def _maybe_explain(self, statement: str, parameters: Any, sql: str) -> None:
+        now = time.monotonic()
+        if now < self._next_explain_at:
+            return
+        self._next_explain_at = now + self.explain_interval
+        task = asyncio.get_running_loop().create_task(
+            self._explain(statement, parameters, sql, current_repository_method.get()))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(
+        self, statement: str, parameters: Any, sql: str, repository_method: str | None
+    ) -> None:
+        # Replayed on a separate connection so the request's transaction is untouched.
+        try:
+            async with self.engine.connect() as conn:
+                conn = await conn.execution_options(**{LOG_OPTION: False})
+                timeout_ms = max(int(self.threshold * 1000) * 10, 1_000)
+                await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters)
+                plan = result.scalar_one()
+                await conn.rollback()
+        except Exception:  # noqa: BLE001 - diagnostics must never fail the app
+            logger.exception("db.slow_query.explain_failed", sql=sql)
+            return
+        logger.warning("db.slow_query.explain", sql=sql,
+                       repository_method=repository_method, plan=plan)
+
+
+def install_slow_query_log(engine: AsyncEngine) -> SlowQueryLog:
+    slow_query_log = SlowQueryLog(
+        engine,
+        threshold_ms=settings.slow_query_threshold_ms,
+        explain=settings.slow_query_explain_enabled,
+        explain_interval_seconds=settings.slow_query_explain_interval_seconds,
+    )
+    slow_query_log.install()
+    return slow_query_log
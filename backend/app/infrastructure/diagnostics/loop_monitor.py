@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import UTC, datetime
+from typing import Any
+
+from opentelemetry import metrics
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+meter = metrics.get_meter(__name__)
+
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000)
+
+
+class LagHistogram:
+    def __init__(self, buckets: tuple[int, ...] = LAG_BUCKETS_MS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        bounds = [str(bound) for bound in self.buckets] + ["+Inf"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(bounds, self.counts, strict=True)),
+        }
+
+
+class LoopMonitor:
+    def __init__(
+        self,
+        *,
+        interval_ms: int = 100,
+        block_threshold_ms: int = 250,
+        max_events: int = 20,
+    ) -> None:
+        self.interval = interval_ms / 1000
+        self.block_threshold = block_threshold_ms / 1000
+        self.histogram = LagHistogram()
+        self.blocked_events: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._otel_histogram = meter.create_histogram(
+            "event_loop.lag", unit="ms", description="Event loop scheduling lag")
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._loop_thread_id = 0
+        self._last_beat = time.monotonic()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._tick(), name="loop-monitor")
+        # The loop cannot observe itself while blocked, so a thread watches the heartbeat.
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self.interval * 2)
+            self._watchdog = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "interval_ms": self.interval * 1000,
+            "block_threshold_ms": self.block_threshold * 1000,
+            "lag": self.histogram.snapshot(),
+            "blocked": list(self.blocked_events),
+        }
+
+    async def _tick(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, loop.time() - started - self.interval) * 1000
+            self.histogram.record(lag_ms)
+            self._otel_histogram.record(lag_ms)
+            self._last_beat = time.monotonic()
+
+    def _watch(self) -> None:
+        reported = False
+        while not self._stopped.wait(self.interval):
+            stalled = time.monotonic() - self._last_beat - self.interval
+            if stalled < self.block_threshold:
+                reported = False
+                continue
+            if reported:
+                continue
+            # Report once per stall, capturing whatever is running on the loop thread right now.
+            reported = True
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = traceback.format_stack(frame) if frame is not None else []
+            event = {
+                "at": datetime.now(UTC).isoformat(),
+                "stalled_ms": round(stalled * 1000, 1),
+                "stack": [line.rstrip() for line in stack],
+            }
+            self.blocked_events.append(event)
+            # structlog reserves "stack" for preformatted stack text.
+            logger.warning("loop.blocked", at=event["at"], stalled_ms=event["stalled_ms"],
+                           loop_stack=event["stack"])
+
+
+loop_monitor = LoopMonitor(
+    interval_ms=settings.loop_monitor_interval_ms,
+    block_threshold_ms=settings.loop_monitor_block_threshold_ms,
+)
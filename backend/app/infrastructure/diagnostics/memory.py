@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from types import CodeType
+from typing import Any, Literal
+
+from fastapi.routing import APIRoute
+from opentelemetry import metrics
+from starlette.routing import BaseRoute
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.diagnostics.profiler import UNATTRIBUTED
+
+logger = get_logger(__name__)
+meter = metrics.get_meter(__name__)
+
+BASELINE = "baseline"
+GroupBy = Literal["module", "route", "line"]
+# Allocations made by tracemalloc and the import machinery are noise in every diff.
+_NOISE = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryTracingError(RuntimeError):
+    pass
+
+
+@dataclass
+class RouteMemory:
+    requests: int = 0
+    exclusive: int = 0
+    peak_max: int = 0
+    peak_total: int = 0
+    growth_total: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "exclusive_requests": self.exclusive,
+            "peak_max_bytes": self.peak_max,
+            "peak_mean_bytes": self.peak_total // self.exclusive if self.exclusive else 0,
+            "growth_total_bytes": self.growth_total,
+        }
+
+
+def _code_lines(code: CodeType) -> tuple[int, int]:
+    lines = [line for _, _, line in code.co_lines() if line is not None]
+    return code.co_firstlineno, max(lines, default=code.co_firstlineno)
+
+
+def route_line_index(routes: Iterable[BaseRoute]) -> dict[str, list[tuple[int, int, str]]]:
+    # tracemalloc frames carry only filename and line, so endpoints are matched by line range.
+    index: dict[str, list[tuple[int, int, str]]] = defaultdict(list)
+    for route in routes:
+        if isinstance(route, APIRoute):
+            code = route.endpoint.__code__
+            methods = ",".join(sorted(route.methods or ()))
+            index[code.co_filename].append((*_code_lines(code), f"{methods} {route.path}"))
+    return dict(index)
+
+
+def _module_names() -> dict[str, str]:
+    names = {}
+    for name, module in list(sys.modules.items()):
+        filename = getattr(module, "__file__", None)
+        if filename:
+            names[os.path.abspath(filename)] = name
+    return names
+
+
+class MemoryTracer:
+    def __init__(
+        self,
+        *,
+        max_seconds: int,
+        max_frames: int,
+        max_overhead_mb: int,
+        max_snapshots: int,
+        check_interval: float = 1.0,
+    ) -> None:
+        self.max_seconds = max_seconds
+        self.max_frames = max_frames
+        self.max_overhead = max_overhead_mb * 1024 * 1024
+        self.max_snapshots = max_snapshots
+        self.check_interval = check_interval
+        self.started_at: float | None = None
+        self.expires_at: float | None = None
+        self.stop_reason: str | None = None
+        self.routes: dict[str, RouteMemory] = defaultdict(RouteMemory)
+        self._snapshots: OrderedDict[str, tracemalloc.Snapshot] = OrderedDict()
+        self._sequence = 0
+        self._task: asyncio.Task[None] | None = None
+        self._peak_histogram = meter.create_histogram(
+            "http.server.request.memory.peak", unit="By",
+            description="Peak traced allocations of requests that ran alone")
+
+    @property
+    def tracing(self) -> bool:
+        return self.started_at is not None
+
+    def start(self, *, seconds: int, frames: int) -> None:
+        if seconds > self.max_seconds or frames > self.max_frames:
+            msg = f"Tracing is limited to {self.max_seconds}s with {self.max_frames} frames"
+            raise ValueError(msg)
+        if self.tracing:
+            msg = "Memory tracing is already running"
+            raise MemoryTracingError(msg)
+        if tracemalloc.is_tracing():
+            msg = "tracemalloc was started outside the diagnostics API"
+            raise MemoryTracingError(msg)
+        tracemalloc.start(frames)
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + seconds
+        self.stop_reason = None
+        self.routes.clear()
+        self._snapshots.clear()
+        self._snapshots[BASELINE] = tracemalloc.take_snapshot().filter_traces(_NOISE)
+        self._task = asyncio.create_task(self._watch(), name="memory-tracer")
+        logger.info("memory.trace_started", seconds=seconds, frames=frames)
+
+    async def stop(self, reason: str = "stopped") -> None:
+        task, self._task = self._task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._stop(reason)
+
+    def take_snapshot(self) -> str:
+        self._require_tracing()
+        self._sequence += 1
+        snapshot_id = str(self._sequence)
+        self._snapshots[snapshot_id] = tracemalloc.take_snapshot().filter_traces(_NOISE)
+        # The baseline stays; the oldest numbered snapshot makes room for the new one.
+        while len(self._snapshots) > self.max_snapshots + 1:
+            oldest = next(key for key in self._snapshots if key != BASELINE)
+            del self._snapshots[oldest]
+        return snapshot_id
+
+    def diff(
+        self,
+        *,
+        since: str = BASELINE,
+        group_by: GroupBy = "module",
+        limit: int = 20,
+        routes: Iterable[BaseRoute] = (),
+    ) -> list[dict[str, Any]]:
+        self._require_tracing()
+        old = self._snapshots.get(since)
+        if old is None:
+            msg = f"Unknown snapshot {since!r}"
+            raise KeyError(msg)
+        new = tracemalloc.take_snapshot().filter_traces(_NOISE)
+        if group_by == "line":
+            rows = [(str(stat.traceback[0]), stat.size_diff, stat.size, stat.count_diff)
+                    for stat in new.compare_to(old, "lineno")]
+        elif group_by == "module":
+            names = _module_names()
+            rows = self._aggregate(
+                (names.get(stat.traceback[0].filename, stat.traceback[0].filename), stat)
+                for stat in new.compare_to(old, "filename"))
+        else:
+            index = route_line_index(routes)
+            rows = self._aggregate(
+                (self._route_for(stat.traceback, index), stat)
+                for stat in new.compare_to(old, "traceback"))
+        rows.sort(key=lambda row: abs(row[1]), reverse=True)
+        return [
+            {"key": key, "size_diff": size_diff, "size": size, "count_diff": count_diff}
+            for key, size_diff, size, count_diff in rows[:limit]
+        ]
+
+    def record_request(self, method: str, route: str, *, growth: int, peak: int | None) -> None:
+        stats = self.routes[f"{method} {route}"]
+        stats.requests += 1
+        stats.growth_total += growth
+        if peak is not None:
+            stats.exclusive += 1
+            stats.peak_total += peak
+            stats.peak_max = max(stats.peak_max, peak)
+            self._peak_histogram.record(
+                peak, {"http.request.method": method, "http.route": route})
+
+    def snapshot(self) -> dict[str, Any]:
+        status: dict[str, Any] = {"tracing": self.tracing, "stop_reason": self.stop_reason}
+        if self.tracing and self.expires_at is not None:
+            current, peak = tracemalloc.get_traced_memory()
+            status.update({
+                "frames": tracemalloc.get_traceback_limit(),
+                "expires_in_seconds": round(max(0.0, self.expires_at - time.monotonic()), 1),
+                "traced_bytes": current,
+                "traced_peak_bytes": peak,
+                "overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+                "snapshots": list(self._snapshots),
+            })
+        status["routes"] = {route: stats.snapshot() for route, stats in self.routes.items()}
+        return status
+
+    def _require_tracing(self) -> None:
+        if not self.tracing:
+            msg = "Memory tracing is not running"
+            raise MemoryTracingError(msg)
+
+    def _stop(self, reason: str) -> None:
+        if not self.tracing:
+            return
+        tracemalloc.stop()
+        self._snapshots.clear()
+        self.started_at = self.expires_at = None
+        self.stop_reason = reason
+        logger.info("memory.trace_stopped", reason=reason)
+
+    async def _watch(self) -> None:
+        # Hard limits so a forgotten trace cannot keep slowing down or bloating the worker.
+        while self.tracing and self.expires_at is not None:
+            await asyncio.sleep(self.check_interval)
+            if time.monotonic() >= self.expires_at:
+                self._stop("time_limit")
+            elif tracemalloc.get_tracemalloc_memory() > self.max_overhead:
+                self._stop("overhead_limit")
+
+    @staticmethod
+    def _aggregate(
+        items: Iterable[tuple[str, tracemalloc.StatisticDiff]],
+    ) -> list[tuple[str, int, int, int]]:
+        totals: dict[str, list[int]] = defaultdict(lambda: [0, 0, 0])
+        for key, stat in items:
+            total = totals[key]
+            total[0] += stat.size_diff
+            total[1] += stat.size
+            total[2] += stat.count_diff
+        return [(key, size_diff, size, count_diff)
+                for key, (size_diff, size, count_diff) in totals.items()]
+
+    @staticmethod
+    def _route_for(
+        traceback: tracemalloc.Traceback, index: dict[str, list[tuple[int, int, str]]]
+    ) -> str:
+        # Frames run oldest to newest; the innermost endpoint frame owns the allocation.
+        for frame in reversed(traceback):
+            for first, last, route in index.get(frame.filename, ()):
+                if first <= frame.lineno <= last:
+                    return route
+        return UNATTRIBUTED
+
+
+memory_tracer = MemoryTracer(
+    max_seconds=settings.memory_trace_max_seconds,
+    max_frames=settings.memory_trace_max_frames,
+    max_overhead_mb=settings.memory_trace_max_overhead_mb,
+    max_snapshots=settings.memory_trace_max_snapshots,
+)
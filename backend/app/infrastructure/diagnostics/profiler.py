@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from types import CodeType, FrameType
+
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute
+
+TRUNCATED = "[truncated]"
+UNATTRIBUTED = "[no route]"
+
+
+@dataclass
+class Profile:
+    samples: int = 0
+    truncated: int = 0
+    stacks: Counter[str] = field(default_factory=Counter)
+
+    def collapsed(self) -> str:
+        lines = [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def route_index(routes: Iterable[BaseRoute]) -> dict[CodeType, str]:
+    index: dict[CodeType, str] = {}
+    for route in routes:
+        if isinstance(route, APIRoute):
+            methods = ",".join(sorted(route.methods or ()))
+            index[route.endpoint.__code__] = f"{methods} {route.path}"
+    return index
+
+
+def _frame_name(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_qualname}"
+
+
+class StackSampler:
+    def __init__(
+        self,
+        *,
+        thread_id: int,
+        hz: int,
+        max_stacks: int,
+        routes: Mapping[CodeType, str],
+        max_depth: int = 128,
+    ) -> None:
+        self.thread_id = thread_id
+        self.interval = 1 / hz
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self.routes = routes
+
+    def run(self, seconds: float) -> Profile:
+        profile = Profile()
+        deadline = time.monotonic() + seconds
+        next_sample = time.monotonic()
+        while (now := time.monotonic()) < deadline:
+            if now < next_sample:
+                time.sleep(next_sample - now)
+            next_sample += self.interval
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                break
+            self._record(profile, frame)
+        return profile
+
+    def _record(self, profile: Profile, frame: FrameType | None) -> None:
+        names: list[str] = []
+        route = UNATTRIBUTED
+        while frame is not None and len(names) < self.max_depth:
+            names.append(_frame_name(frame))
+            if route == UNATTRIBUTED and frame.f_code in self.routes:
+                route = self.routes[frame.f_code]
+            frame = frame.f_back
+        names.append(route)
+        stack = ";".join(reversed(names))
+
+        profile.samples += 1
+        if stack not in profile.stacks and len(profile.stacks) >= self.max_stacks:
+            profile.truncated += 1
+            stack = f"{route};{TRUNCATED}"
+        profile.stacks[stack] += 1
+
+
+# Only one profile runs per worker at a time.
+profile_lock = threading.Lock()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import smtplib
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.logging import get_logger
+from app.domain.models.email_outbox import EmailOutbox
+from app.infrastructure.auth.providers import EmailProvider
+
+logger = get_logger(__name__)
+
+# Errors tied to a single message; anything else means the connection itself failed.
+MESSAGE_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError)
+
+
+def _schedule_retry(
+    row: EmailOutbox, error: Exception, *, max_attempts: int, backoff_seconds: int
+) -> None:
+    row.attempts += 1
+    row.last_error = str(error)[:2_000]
+    if row.attempts >= max_attempts:
+        row.status = "failed"
+        logger.error("email.outbox.failed", outbox_id=str(row.id), attempts=row.attempts)
+        return
+    delay = min(backoff_seconds * 2 ** (row.attempts - 1), 3_600)
+    row.next_attempt_at = datetime.now(UTC) + timedelta(seconds=delay)
+
+
+def drain_outbox(
+    session_factory: sessionmaker[Session],
+    provider: EmailProvider,
+    *,
+    batch_size: int,
+    max_attempts: int,
+    backoff_seconds: int,
+) -> int:
+    sent = 0
+    connection_error: Exception | None = None
+    with session_factory() as session, session.begin():
+        # SKIP LOCKED lets several workers drain concurrently without double-sending.
+        rows = session.scalars(
+            select(EmailOutbox)
+            .where(EmailOutbox.status == "pending",
+                   EmailOutbox.next_attempt_at <= datetime.now(UTC))
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if not rows:
+            return 0
+
+        current: EmailOutbox | None = None
+        try:
+            with provider.connection() as smtp:
+                for row in rows:
+                    current = row
+                    message = provider.build_message(
+                        to_email=row.recipient, subject=row.subject,
+                        body=row.body, message_key=str(row.id))
+                    try:
+                        smtp.send_message(message)
+                    except MESSAGE_ERRORS as exc:
+                        _schedule_retry(row, exc, max_attempts=max_attempts,
+                                        backoff_seconds=backoff_seconds)
+                        continue
+                    row.status = "sent"
+                    row.sent_at = datetime.now(UTC)
+                    sent += 1
+        except (smtplib.SMTPException, OSError) as exc:
+            # Keep the progress made so far; only the in-flight message is retried.
+            connection_error = exc
+            if current is not None and current.status == "pending":
+                _schedule_retry(current, exc, max_attempts=max_attempts,
+                                backoff_seconds=backoff_seconds)
+
+    logger.info("email.outbox.drained", sent=sent, claimed=len(rows))
+    if connection_error is not None:
+        raise connection_error
+    return sent
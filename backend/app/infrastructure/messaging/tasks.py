@@ -1,8 +1,20 @@
 from __future__ import annotations
 
-from celery import Celery
+import smtplib
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any
+
+from celery import Celery, Task
 
 from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.audit.partitions import drop_expired_partitions, ensure_partitions
+from app.infrastructure.auth.providers import EmailProvider
+from app.infrastructure.db.session import get_sync_sessionmaker
+from app.infrastructure.messaging.outbox import drain_outbox
+
+logger = get_logger(__name__)
 
 celery_app = Celery(
     "fastapi_vue_template",
@@ -10,12 +22,80 @@ celery_app = Celery(
     backend=settings.celery_result_backend,
 )
 
+# Kombu cannot use Redis Cluster, so the broker stays a standalone Redis in cluster mode.
+# With Sentinel, point CELERY_BROKER_URL/CELERY_RESULT_BACKEND at sentinel://host:26379;...
+if settings.redis_mode == "sentinel":
+    sentinel_options: dict[str, Any] = {"master_name": settings.redis_sentinel_service}
+    if settings.redis_sentinel_password:
+        sentinel_options["sentinel_kwargs"] = {"password": settings.redis_sentinel_password}
+    celery_app.conf.broker_transport_options = sentinel_options
+    celery_app.conf.result_backend_transport_options = sentinel_options
+
 celery_app.conf.task_routes = {
     "app.infrastructure.messaging.tasks.*": {"queue": "default"}}
 celery_app.conf.task_default_retry_delay = 5
 celery_app.conf.task_default_queue = "default"
+celery_app.conf.beat_schedule = {
+    "deliver-email-outbox": {
+        "task": "app.infrastructure.messaging.tasks.deliver_outbox",
+        "schedule": settings.outbox_poll_interval_seconds,
+    },
+    "maintain-auth-event-partitions": {
+        "task": "app.infrastructure.messaging.tasks.maintain_auth_event_partitions",
+        "schedule": 6 * 60 * 60,
+    },
+}
+
+
+@lru_cache(1)
+def email_provider() -> EmailProvider | None:
+    if not settings.smtp_host or not settings.smtp_port:
+        return None
+    # Cached per worker process so SMTP connections are reused across task runs.
+    return EmailProvider(
+        host=settings.smtp_host,
+        port=settings.smtp_port,
+        username=settings.smtp_username or None,
+        password=settings.smtp_password or None,
+        sender=settings.smtp_sender,
+        use_tls=settings.smtp_use_tls,
+        timeout=settings.smtp_timeout_seconds,
+        pool_size=settings.smtp_pool_size,
+    )
 
 
 @celery_app.task(bind=True, ignore_result=False)
 def heartbeat(self) -> str:  # type: ignore[override]
     return "alive"
+
+
+@celery_app.task(bind=True, ignore_result=True, max_retries=5)  # type: ignore[misc]
+def deliver_outbox(self: Task) -> int:
+    provider = email_provider()
+    if provider is None:
+        logger.warning("email.outbox.smtp_not_configured")
+        return 0
+    try:
+        return drain_outbox(
+            get_sync_sessionmaker(),
+            provider,
+            batch_size=settings.outbox_batch_size,
+            max_attempts=settings.outbox_max_attempts,
+            backoff_seconds=settings.outbox_retry_backoff_seconds,
+        )
+    except (smtplib.SMTPException, OSError) as exc:
+        countdown = settings.outbox_retry_backoff_seconds * 2 ** self.request.retries
+        raise self.retry(exc=exc, countdown=countdown) from exc
+
+
+@celery_app.task(ignore_result=True)  # type: ignore[misc]
+def maintain_auth_event_partitions() -> None:
+    now = datetime.now(UTC)
+    session_factory = get_sync_sessionmaker()
+    with session_factory() as session, session.begin():
+        connection = session.connection()
+        created = ensure_partitions(
+            connection, now=now, months_ahead=settings.auth_events_partitions_ahead)
+        dropped = drop_expired_partitions(
+            connection, now=now, retention_days=settings.auth_events_retention_days)
+    logger.info("auth_events.partitions", created=created, dropped=dropped)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from contextlib import AsyncExitStack
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.infrastructure.cache.redis import RedisClient, get_redis_client
+from app.infrastructure.db.loaders import user_loader
+from app.infrastructure.db.repositories.users import UserRepository
+from app.infrastructure.db.session import SessionLocal, engine
+
+logger = get_logger(__name__)
+
+
+async def warm_db_pool(db_engine: AsyncEngine, count: int) -> int:
+    # Connections beyond pool_size are overflow and would be closed again on checkin.
+    count = min(count, db_engine.pool.size())  # type: ignore[attr-defined]
+    # Check out every connection at once; sequential checkouts would reuse the first one.
+    async with AsyncExitStack() as stack:
+        connections = await asyncio.gather(
+            *(stack.enter_async_context(db_engine.connect()) for _ in range(count)))
+        await asyncio.gather(*(connection.execute(text("SELECT 1"))
+                               for connection in connections))
+    return len(connections)
+
+
+async def warm_redis_pool(redis: RedisClient, count: int) -> int:
+    # Concurrent commands each take their own connection from the pool.
+    count = min(count, settings.redis_max_connections)
+    await asyncio.gather(*(redis.ping() for _ in range(count)))
+    return count
+
+
+async def preload_hot_users(limit: int) -> int:
+    async with SessionLocal() as session:
+        user_ids = await UserRepository(session).recently_active_ids(limit)
+    # Runs the same projected lookup get_current_user uses, warming its plans and pages.
+    users = await user_loader.load_many(user_ids)
+    return sum(user is not None for user in users)
+
+
+class Warmup:
+    def __init__(
+        self,
+        *,
+        db_connections: int,
+        redis_connections: int,
+        hot_users: int,
+        timeout_seconds: float,
+    ) -> None:
+        self.db_connections = db_connections
+        self.redis_connections = redis_connections
+        self.hot_users = hot_users
+        self.timeout = timeout_seconds
+        self.ready = asyncio.Event()
+        self.report: dict[str, Any] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self.ready.clear()
+            self._task = asyncio.create_task(self._run(), name="warmup")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"ready": self.ready.is_set(), **self.report}
+
+    async def run(self) -> dict[str, Any]:
+        redis = await get_redis_client()
+        db, cache = await asyncio.gather(
+            warm_db_pool(engine, self.db_connections),
+            warm_redis_pool(redis, self.redis_connections),
+        )
+        report: dict[str, Any] = {"db_connections": db, "redis_connections": cache}
+        if self.hot_users:
+            report["hot_users"] = await preload_hot_users(self.hot_users)
+        return report
+
+    async def _run(self) -> None:
+        started = time.perf_counter()
+        try:
+            self.report = await asyncio.wait_for(self.run(), timeout=self.timeout)
+            self.report["status"] = "complete"
+        except TimeoutError:
+            self.report = {"status": "timeout"}
+            logger.warning("app.warmup_timeout", timeout_seconds=self.timeout)
+        except Exception as exc:  # noqa: BLE001 - warmup is best effort
+            self.report = {"status": "failed", "error": repr(exc)}
+            logger.exception("app.warmup_failed")
+        finally:
+            # Readiness is only held back for the bounded warmup, never indefinitely.
+            self.report["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            self.ready.set()
+        logger.info("app.warmup", **self.report)
+
+
+warmup = Warmup(
+    db_connections=settings.warmup_db_connections,
+    redis_connections=settings.warmup_redis_connections,
+    hot_users=settings.warmup_hot_users,
+    timeout_seconds=settings.warmup_timeout_seconds,
+)
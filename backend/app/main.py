@@ -6,11 +6,23 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
+from app.api.middleware import (
+    AdaptiveLimiter,
+    AdmissionControlMiddleware,
+    CompressionMiddleware,
+    DeadlineMiddleware,
+    MemoryTrackingMiddleware,
+)
 from app.api.router import api_router
+from app.api.spa import SpaStaticFiles
 from app.core.config import settings
 from app.core.logging import configure_logging, get_logger
+from app.infrastructure.audit.events import auth_events
 from app.infrastructure.cache.redis import close_redis_client
 from app.infrastructure.db.session import engine
+from app.infrastructure.diagnostics.loop_monitor import loop_monitor
+from app.infrastructure.diagnostics.memory import memory_tracer
+from app.infrastructure.warmup import warmup
 
 logger = get_logger(__name__)
 
@@ -21,9 +33,21 @@ async def lifespan(_: FastAPI):
     logger.info("app.startup")
     async with engine.begin() as conn:
         await conn.execute(text("SELECT 1"))
+    # Runs in the background; /health/ready reports 503 until it finishes or times out.
+    if settings.warmup_enabled:
+        warmup.start()
+    else:
+        warmup.ready.set()
+    if settings.loop_monitor_enabled:
+        loop_monitor.start()
+    auth_events.start()
     try:
         yield
     finally:
+        await warmup.stop()
+        await auth_events.stop()
+        await loop_monitor.stop()
+        await memory_tracer.stop()
         await engine.dispose()
         await close_redis_client()
         logger.info("app.shutdown")
@@ -36,6 +60,51 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+default_limiter = AdaptiveLimiter(
+    "default",
+    initial_limit=settings.admission_default_limit,
+    max_limit=settings.admission_default_max_limit,
+    target_latency_ms=settings.admission_default_target_latency_ms,
+    max_queue=settings.admission_max_queue,
+)
+expensive_limiter = AdaptiveLimiter(
+    "expensive",
+    initial_limit=settings.admission_expensive_limit,
+    max_limit=settings.admission_expensive_max_limit,
+    target_latency_ms=settings.admission_expensive_target_latency_ms,
+    max_queue=settings.admission_max_queue,
+)
+app.state.admission_limiters = [default_limiter, expensive_limiter]
+
+# With the SPA mounted, asset downloads run as long as the client's bandwidth needs;
+# neither the request deadline nor the latency-driven limiters should see them.
+api_prefixes = ("/api/",) if settings.spa_dist_dir else None
+
+# Innermost, so only the application's own allocations count towards a request.
+# A pass-through unless tracing was started from /diagnostics/memory/start.
+app.add_middleware(MemoryTrackingMiddleware, tracer=memory_tracer)
+
+# Added before CORS so shed responses still carry CORS headers.
+if settings.admission_enabled:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        default=default_limiter,
+        routes=[(("/api/v1/auth/login", "/api/v1/auth/register"), expensive_limiter)],
+        exempt_prefixes=("/api/v1/health",),
+        include_prefixes=api_prefixes,
+        queue_timeout_ms=settings.admission_queue_timeout_ms,
+        retry_after_seconds=settings.admission_retry_after_seconds,
+    )
+
+# Outside admission control so time spent queued counts against the deadline.
+app.add_middleware(
+    DeadlineMiddleware,
+    default_ms=settings.request_timeout_ms,
+    max_ms=settings.request_timeout_max_ms,
+    overrides=settings.request_timeout_overrides,
+    include_prefixes=api_prefixes,
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors.allow_origins,
@@ -44,9 +113,20 @@ app.add_middleware(
     allow_headers=settings.cors.allow_headers,
 )
 
-app.include_router(api_router, prefix="/api")
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+)
 
+app.include_router(api_router, prefix="/api")
 
-@app.get("/", tags=["health"])
-async def root() -> dict[str, str]:
-    return {"message": "FastAPI Vue Template backend"}
+if settings.spa_dist_dir:
+    # Mounted last so every API route matches first; the SPA owns everything else.
+    app.mount("/", SpaStaticFiles(settings.spa_dist_dir,
+                                  sendfile_min_size=settings.spa_sendfile_min_size), name="spa")
+else:
+    @app.get("/", tags=["health"])
+    async def root() -> dict[str, str]:
+        return {"message": "FastAPI Vue Template backend"}
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AuthEventRead(BaseModel):
+    id: UUID
+    occurred_at: datetime
+    event_type: str
+    user_id: UUID | None = None
+    data: dict[str, Any]
+
+    model_config = ConfigDict(from_attributes=True)
@@ -32,3 +32,8 @@ class UserRead(UserBase):
 
 class UserInDB(UserRead):
     hashed_password: str
+
+
+class UserSearchPage(BaseModel):
+    items: list[UserRead]
+    next_cursor: str | None = None
@@ -3,10 +3,10 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.deadline import bounded
 from app.core.logging import get_logger
 from app.core.security import (
     create_access_token,
@@ -17,6 +17,9 @@ from app.core.security import (
     is_token_type,
 )
 from app.domain.models.user import User
+from app.infrastructure.audit.events import auth_events
+from app.infrastructure.cache.keys import access_token_key
+from app.infrastructure.cache.redis import RedisClient
 from app.infrastructure.db.repositories.users import UserRepository
 from app.schemas.token import TokenResponse
 from app.schemas.user import UserCreate
@@ -26,7 +29,7 @@ logger = get_logger(__name__)
 
 
 class AuthService:
-    def __init__(self, session: AsyncSession, redis: Redis) -> None:
+    def __init__(self, session: AsyncSession, redis: RedisClient) -> None:
         self.session = session
         self.redis = redis
         self.users = UserRepository(session)
@@ -39,10 +42,12 @@ class AuthService:
     async def login(self, email: str, password: str) -> TokenResponse:
         user = await self.user_service.authenticate(email, password)
         if user is None:
+            auth_events.record("auth.login_failed", email=email)
             msg = "Invalid credentials"
             raise ValueError(msg)
         token_response = await self._issue_tokens(user)
         logger.info("auth.login", user_id=user.id)
+        auth_events.record("auth.login", user_id=user.id)
         return token_response
 
     async def refresh(self, refresh_token: str) -> TokenResponse:
@@ -65,6 +70,7 @@ class AuthService:
         token_response = await self._issue_tokens(user)
         logger.info("auth.refresh", user_id=user.id,
                     old_token_id=str(token_id))
+        auth_events.record("auth.refresh", user_id=user.id, old_token_id=token_id)
         return token_response
 
     async def logout(self, refresh_token: str) -> None:
@@ -75,6 +81,7 @@ class AuthService:
         await self.users.revoke_refresh_token(token_id)
         await self.session.commit()
         logger.info("auth.logout", token_id=str(token_id))
+        auth_events.record("auth.logout", user_id=UUID(get_subject(payload)), token_id=token_id)
 
     async def _issue_tokens(self, user: User) -> TokenResponse:
         access = create_access_token(str(user.id))
@@ -87,16 +94,13 @@ class AuthService:
         )
         await self.session.commit()
 
-        await self.redis.setex(
-            f"access:{access['jti']}",
-            settings.jwt_expires_in_seconds,
-            str(user.id),
-        )
-        await self.redis.setex(
-            f"refresh:{refresh['jti']}",
-            settings.jwt_refresh_expires_in_seconds,
-            str(user.id),
-        )
+        # Refresh tokens are validated against PostgreSQL, so only access ids are cached.
+        async with bounded("redis"):
+            await self.redis.set(
+                access_token_key(user.id, UUID(access["jti"])),
+                b"",
+                ex=settings.jwt_expires_in_seconds,
+            )
 
         return TokenResponse(
             access_token=access["token"],
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import IO
+from uuid import UUID, uuid4
+
+from pydantic import EmailStr, TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.core.security import get_password_hash
+from app.infrastructure.db.repositories.users import UserRepository
+
+logger = get_logger(__name__)
+
+ImportRow = tuple[UUID, str, str, str | None]
+
+# Same validation and normalisation as registration, so imported users can log in.
+_email_adapter: TypeAdapter[str] = TypeAdapter(EmailStr)
+
+
+@dataclass(frozen=True, slots=True)
+class ImportedUser:
+    email: str
+    full_name: str | None = None
+    password: str | None = None
+    hashed_password: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ImportResult:
+    copied: int
+    inserted: int
+
+    @property
+    def skipped(self) -> int:
+        return self.copied - self.inserted
+
+
+def _parse_record(record: dict[str, object], line: int) -> ImportedUser:
+    email = str(record.get("email") or "").strip()
+    if not email:
+        msg = f"Record {line}: missing email"
+        raise ValueError(msg)
+    try:
+        email = _email_adapter.validate_python(email)
+    except ValidationError as exc:
+        msg = f"Record {line}: invalid email {email!r}: {exc.errors()[0]['msg']}"
+        raise ValueError(msg) from None
+    password = record.get("password") or None
+    hashed_password = record.get("hashed_password") or None
+    if password is None and hashed_password is None:
+        msg = f"Record {line}: either password or hashed_password is required"
+        raise ValueError(msg)
+    full_name = record.get("full_name") or None
+    return ImportedUser(
+        email=email,
+        full_name=str(full_name) if full_name is not None else None,
+        password=str(password) if password is not None else None,
+        hashed_password=str(hashed_password) if hashed_password is not None else None,
+    )
+
+
+def read_csv(stream: IO[str]) -> Iterator[ImportedUser]:
+    for line, record in enumerate(csv.DictReader(stream), start=1):
+        yield _parse_record(record, line)
+
+
+def read_ndjson(stream: IO[str]) -> Iterator[ImportedUser]:
+    for line, raw in enumerate(stream, start=1):
+        if raw.strip():
+            yield _parse_record(json.loads(raw), line)
+
+
+def _to_row(record: ImportedUser) -> ImportRow:
+    hashed_password = record.hashed_password
+    if hashed_password is None:
+        hashed_password = get_password_hash(record.password or "")
+    return (uuid4(), record.email, hashed_password, record.full_name)
+
+
+def _chunks(records: Iterable[ImportedUser], size: int) -> Iterator[list[ImportedUser]]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class UserImportService:
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        batch_size: int = 5_000,
+        hash_workers: int | None = None,
+    ) -> None:
+        self.session = session
+        self.users = UserRepository(session)
+        self.batch_size = batch_size
+        self.hash_workers = hash_workers
+
+    async def import_users(self, records: Iterable[ImportedUser]) -> ImportResult:
+        # bcrypt releases the GIL, so a thread pool hashes in parallel without pickling.
+        with ThreadPoolExecutor(max_workers=self.hash_workers) as executor:
+            copied, inserted = await self.users.copy_users(self._hashed_batches(records, executor))
+        await self.session.commit()
+        result = ImportResult(copied=copied, inserted=inserted)
+        logger.info("user.import", copied=result.copied,
+                    inserted=result.inserted, skipped=result.skipped)
+        return result
+
+    async def _hashed_batches(
+        self, records: Iterable[ImportedUser], executor: Executor
+    ) -> AsyncIterator[list[ImportRow]]:
+        loop = asyncio.get_running_loop()
+
+        def hash_batch(chunk: list[ImportedUser]) -> asyncio.Future[list[ImportRow]]:
+            return asyncio.gather(*(loop.run_in_executor(executor, _to_row, record)
+                                    for record in chunk))
+
+        chunks = _chunks(records, self.batch_size)
+        first = next(chunks, None)
+        if first is None:
+            return
+        pending = hash_batch(first)
+        for chunk in chunks:
+            # Hash the next batch while the current one is being copied.
+            ready = await pending
+            pending = hash_batch(chunk)
+            yield ready
+        yield await pending
@@ -8,6 +8,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logging import get_logger
 from app.core.security import get_password_hash, verify_password
 from app.domain.models.user import User
+from app.infrastructure.audit.events import auth_events
+from app.infrastructure.auth.providers import render_welcome_email
+from app.infrastructure.db.repositories.outbox import OutboxRepository
 from app.infrastructure.db.repositories.users import UserRepository
 from app.schemas.user import UserCreate
 
@@ -18,22 +21,30 @@ class UserService:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
         self.users = UserRepository(session)
+        self.outbox = OutboxRepository(session)
 
     async def register_user(self, payload: UserCreate) -> User:
-        existing = await self.users.get_by_email(payload.email)
-        if existing:
-            msg = "User with this email already exists"
-            raise ValueError(msg)
-
         hashed_password = get_password_hash(payload.password)
         user = await self.users.create(
             email=payload.email,
             hashed_password=hashed_password,
             full_name=payload.full_name,
         )
+        if user is None:
+            await self.session.rollback()
+            msg = "User with this email already exists"
+            raise ValueError(msg)
+        # Queued in the same transaction; a Celery worker delivers it after commit.
+        subject, body = render_welcome_email(full_name=user.full_name)
+        await self.outbox.enqueue(
+            idempotency_key=f"welcome:{user.id}",
+            recipient=user.email,
+            subject=subject,
+            body=body,
+        )
         await self.session.commit()
-        await self.session.refresh(user)
         logger.info("user.created", user_id=user.id, email=user.email)
+        auth_events.record("user.created", user_id=user.id, email=user.email)
         return user
 
     async def authenticate(self, email: str, password: str) -> User | None:
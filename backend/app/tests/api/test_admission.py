@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from starlette.responses import PlainTextResponse
+from starlette.types import Message, Receive, Scope, Send
+
+from app.api.middleware.admission import AdaptiveLimiter, AdmissionControlMiddleware
+from app.core.deadline import set_deadline
+
+
+async def noop(scope: Scope, receive: Receive, send: Send) -> None:
+    pass
+
+
+# Requests to a path ending in /slow hold their slot until the gate opens.
+class GatedApp:
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.paths: list[str] = []
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.paths.append(scope["path"])
+        if scope["path"].endswith("/slow"):
+            await self.gate.wait()
+        await PlainTextResponse("ok")(scope, receive, send)
+
+
+def make_middleware(
+    app: GatedApp, *, max_queue: int = 0, queue_timeout_ms: int = 500
+) -> tuple[AdmissionControlMiddleware, AdaptiveLimiter, AdaptiveLimiter]:
+    default = AdaptiveLimiter("default", initial_limit=1, max_limit=1,
+                              target_latency_ms=1_000, max_queue=max_queue)
+    expensive = AdaptiveLimiter("expensive", initial_limit=1, max_limit=1,
+                                target_latency_ms=1_000, max_queue=max_queue)
+    middleware = AdmissionControlMiddleware(
+        app,
+        default=default,
+        routes=[(("/api/v1/auth/login", "/api/v1/auth/register"), expensive)],
+        exempt_prefixes=("/api/v1/health",),
+        queue_timeout_ms=queue_timeout_ms,
+        retry_after_seconds=2,
+    )
+    return middleware, default, expensive
+
+
+async def request(middleware: AdmissionControlMiddleware, path: str) -> list[Message]:
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path, "headers": []}
+    await middleware(scope, receive, send)
+    return messages
+
+
+@pytest.mark.anyio
+async def test_limiter_queues_then_rejects_overflow() -> None:
+    limiter = AdaptiveLimiter("test", initial_limit=1, max_limit=4,
+                              target_latency_ms=100, max_queue=1)
+    assert await limiter.acquire(0.1)
+
+    queued = asyncio.ensure_future(limiter.acquire(1))
+    await asyncio.sleep(0)
+    assert not await limiter.acquire(1)  # queue is full
+
+    limiter.release(0.01)
+    assert await queued
+    assert limiter.inflight == 1
+    assert limiter.rejected == 1
+
+
+@pytest.mark.anyio
+async def test_limiter_times_out_queued_requests() -> None:
+    limiter = AdaptiveLimiter("test", initial_limit=1, max_limit=4, target_latency_ms=100)
+    assert await limiter.acquire(0.1)
+    assert not await limiter.acquire(0.01)
+    assert limiter.snapshot()["queued"] == 0
+
+
+def test_limiter_grows_on_fast_and_backs_off_on_slow_completions() -> None:
+    limiter = AdaptiveLimiter("test", initial_limit=10, max_limit=20, target_latency_ms=100)
+    limiter.inflight = 2
+    limiter.release(0.01)
+    assert limiter.limit == pytest.approx(10.1)
+    limiter.release(0.5)
+    assert limiter.limit == pytest.approx(9.09)
+
+
+def test_only_included_prefixes_are_limited() -> None:
+    limiter = AdaptiveLimiter("test", initial_limit=1, max_limit=4, target_latency_ms=100)
+    middleware = AdmissionControlMiddleware(
+        noop, default=limiter, exempt_prefixes=("/api/v1/health",), include_prefixes=("/api/",))
+    assert middleware.limiter_for("/api/v1/users") is limiter
+    assert middleware.limiter_for("/api/v1/health/live") is None
+    assert middleware.limiter_for("/assets/index-BXk2a9_c.js") is None
+    assert middleware.limiter_for("/dashboard") is None
+
+
+@pytest.mark.anyio
+async def test_saturated_limiter_sheds_fast_with_retry_after() -> None:
+    app = GatedApp()
+    middleware, default, _ = make_middleware(app, queue_timeout_ms=5_000)
+    held = asyncio.ensure_future(request(middleware, "/api/v1/users/slow"))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    messages = await request(middleware, "/api/v1/users/me")
+    assert time.perf_counter() - started < 1
+    assert messages[0]["status"] == 503
+    assert (b"retry-after", b"2") in messages[0]["headers"]
+    assert app.paths == ["/api/v1/users/slow"]
+    assert default.rejected == 1
+
+    app.gate.set()
+    assert (await held)[0]["status"] == 200
+    assert default.inflight == 0
+
+
+@pytest.mark.anyio
+async def test_auth_routes_have_their_own_budget_and_health_is_exempt() -> None:
+    app = GatedApp()
+    middleware, default, expensive = make_middleware(app)
+    held = asyncio.ensure_future(request(middleware, "/api/v1/auth/login/slow"))
+    await asyncio.sleep(0)
+
+    # The expensive budget is full, but the default one and health probes are not.
+    assert (await request(middleware, "/api/v1/auth/register"))[0]["status"] == 503
+    assert (await request(middleware, "/api/v1/users/me"))[0]["status"] == 200
+    assert (await request(middleware, "/api/v1/health/ready"))[0]["status"] == 200
+    assert (expensive.accepted, expensive.rejected) == (1, 1)
+    assert (default.accepted, default.rejected) == (1, 0)
+
+    app.gate.set()
+    await held
+
+
+@pytest.mark.anyio
+async def test_queue_wait_is_capped_by_the_remaining_deadline() -> None:
+    app = GatedApp()
+    middleware, default, _ = make_middleware(app, max_queue=10, queue_timeout_ms=5_000)
+    held = asyncio.ensure_future(request(middleware, "/api/v1/users/slow"))
+    await asyncio.sleep(0)
+
+    set_deadline(0.05)
+    started = time.perf_counter()
+    messages = await request(middleware, "/api/v1/users/me")
+    assert time.perf_counter() - started < 1
+    assert messages[0]["status"] == 503
+    assert default.snapshot()["queued"] == 0
+
+    app.gate.set()
+    await held
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, Header, Response
+from httpx import AsyncClient
+
+from app.api.caching import encoded_etag, etag_matches, make_etag, not_modified, set_etag
+from app.api.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+
+def test_etag_matches_strong_weak_and_wildcard_validators() -> None:
+    etag = make_etag("user", "2026-01-01T00:00:00+00:00")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_negotiate_encoding_prefers_brotli_when_available() -> None:
+    assert negotiate_encoding("gzip, br", brotli_available=True) == "br"
+    assert negotiate_encoding("gzip, br", brotli_available=False) == "gzip"
+    assert negotiate_encoding("br;q=0, gzip;q=0.5", brotli_available=True) == "gzip"
+    assert negotiate_encoding("identity", brotli_available=True) is None
+
+
+def test_compressed_etags_differ_but_still_match_for_revalidation() -> None:
+    etag = make_etag("users", 3)
+    assert encoded_etag(etag, "gzip") != encoded_etag(etag, "br") != etag
+    assert etag_matches(encoded_etag(etag, "gzip"), etag)
+    assert etag_matches(f"W/{encoded_etag(etag, 'br')}", etag)
+    assert encoded_etag(f"W/{etag}", "gzip") == f"W/{etag}"
+
+
+@pytest.mark.anyio
+async def test_compression_gives_each_encoding_its_own_strong_etag() -> None:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=16)
+    etag = make_etag("users", 3)
+
+    @app.get("/users")
+    async def users(response: Response, if_none_match: str | None = Header(None)) -> Any:
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+        return [{"email": f"user-{i}@example.com"} for i in range(20)]
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        plain = await client.get("/users", headers={"Accept-Encoding": "identity"})
+        gzipped = await client.get("/users", headers={"Accept-Encoding": "gzip"})
+        revalidated = await client.get("/users", headers={
+            "Accept-Encoding": "gzip", "If-None-Match": gzipped.headers["etag"]})
+
+    assert plain.headers["etag"] == etag
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["etag"] == encoded_etag(etag, "gzip")
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == gzipped.headers["etag"]
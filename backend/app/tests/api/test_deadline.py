@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from psycopg.errors import QueryCanceled
+from sqlalchemy.exc import DBAPIError
+from starlette.types import Message, Receive, Scope, Send
+
+from app.api.middleware.deadline import DeadlineMiddleware
+from app.core.deadline import (
+    DeadlineExceeded,
+    bounded,
+    request_deadline,
+    set_deadline,
+    timeout_counts,
+)
+
+
+def make_scope(path: str = "/api/v1/users", headers: dict[str, str] | None = None) -> Scope:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": [(key.encode(), value.encode()) for key, value in (headers or {}).items()],
+    }
+
+
+async def call(middleware: DeadlineMiddleware, scope: Scope) -> list[Message]:
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await middleware(scope, receive, send)
+    return messages
+
+
+async def noop(scope: Scope, receive: Receive, send: Send) -> None:
+    pass
+
+
+def test_budget_comes_from_header_override_or_default() -> None:
+    middleware = DeadlineMiddleware(
+        noop, default_ms=1_000, max_ms=5_000,
+        overrides={"/api/v1/users": 2_000, "/api/v1/users/import": 30_000})
+
+    assert middleware.budget_ms(make_scope("/api/v1/auth/login")) == 1_000
+    assert middleware.budget_ms(make_scope("/api/v1/users/me")) == 2_000
+    assert middleware.budget_ms(make_scope("/api/v1/users/import")) == 30_000
+    assert middleware.budget_ms(make_scope(headers={"x-request-timeout": "250"})) == 250
+    assert middleware.budget_ms(make_scope(headers={"x-request-timeout": "60000"})) == 5_000
+    assert middleware.budget_ms(make_scope(headers={"x-request-timeout": "0"})) == 1
+    assert middleware.budget_ms(make_scope(headers={"x-request-timeout": "soon"})) == 2_000
+
+
+@pytest.mark.anyio
+async def test_timeout_before_the_response_starts_returns_504() -> None:
+    async def slow(scope: Scope, receive: Receive, send: Send) -> None:
+        await asyncio.sleep(1)
+
+    before = timeout_counts["request"]
+    messages = await call(DeadlineMiddleware(slow, default_ms=20, max_ms=1_000), make_scope())
+
+    assert messages[0]["type"] == "http.response.start"
+    assert messages[0]["status"] == 504
+    assert timeout_counts["request"] == before + 1
+    assert request_deadline.get() is None
+
+
+@pytest.mark.anyio
+async def test_timeout_after_the_response_starts_sends_nothing_more() -> None:
+    async def streaming(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"[", "more_body": True})
+        await asyncio.sleep(1)
+
+    messages = await call(DeadlineMiddleware(streaming, default_ms=20, max_ms=1_000),
+                          make_scope())
+
+    assert [message.get("status") for message in messages] == [200, None]
+
+
+@pytest.mark.anyio
+async def test_paths_outside_the_included_prefixes_have_no_deadline() -> None:
+    deadlines: list[float | None] = []
+
+    async def slow_download(scope: Scope, receive: Receive, send: Send) -> None:
+        deadlines.append(request_deadline.get())
+        await asyncio.sleep(0.05)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    middleware = DeadlineMiddleware(slow_download, default_ms=20, max_ms=1_000,
+                                    include_prefixes=("/api/",))
+    messages = await call(middleware, make_scope("/assets/index-BXk2a9_c.js"))
+    assert [message["status"] for message in messages] == [200]
+    assert deadlines == [None]
+
+    messages = await call(middleware, make_scope("/api/v1/users"))
+    assert messages[0]["status"] == 504
+
+
+@pytest.mark.anyio
+async def test_cancelled_queries_are_counted_as_db_timeouts() -> None:
+    async def cancelled(scope: Scope, receive: Receive, send: Send) -> None:
+        raise DBAPIError("SELECT pg_sleep(10)", None, QueryCanceled("canceling statement"))
+
+    before = timeout_counts["db"]
+    messages = await call(DeadlineMiddleware(cancelled, default_ms=1_000, max_ms=1_000),
+                          make_scope())
+
+    assert messages[0]["status"] == 504
+    assert timeout_counts["db"] == before + 1
+
+
+@pytest.mark.anyio
+async def test_other_database_errors_propagate() -> None:
+    async def broken(scope: Scope, receive: Receive, send: Send) -> None:
+        raise DBAPIError("SELECT 1", None, Exception("connection refused"))
+
+    with pytest.raises(DBAPIError):
+        await call(DeadlineMiddleware(broken, default_ms=1_000, max_ms=1_000), make_scope())
+
+
+@pytest.mark.anyio
+async def test_bounded_turns_timeouts_into_deadline_exceeded() -> None:
+    async def wait(seconds: float) -> Any:
+        set_deadline(seconds)
+        async with bounded("redis"):
+            await asyncio.sleep(1)
+
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        await asyncio.create_task(wait(0.01))
+    assert exc_info.value.kind == "redis"
+
+    # An exhausted budget fails before the call is even attempted.
+    with pytest.raises(DeadlineExceeded):
+        await asyncio.create_task(wait(-1))
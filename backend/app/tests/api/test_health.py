@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 from httpx import AsyncClient
 
+from app.infrastructure.warmup import warmup
 from app.main import app
 
 
@@ -12,3 +13,14 @@ async def test_liveness() -> None:
         response = await client.get("/api/v1/health/live")
     assert response.status_code == 200
     assert response.json() == {"status": "alive"}
+
+
+@pytest.mark.anyio
+async def test_readiness_waits_for_warmup() -> None:
+    warmup.ready.clear()
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        warming = await client.get("/api/v1/health/ready")
+        warmup.ready.set()
+        ready = await client.get("/api/v1/health/ready")
+    assert warming.status_code == 503
+    assert ready.json() == {"status": "ready"}
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.types import Message
+
+from app.api.middleware.compression import CompressionMiddleware
+from app.api.spa import (
+    IMMUTABLE_CACHE_CONTROL,
+    ZEROCOPY_EXTENSION,
+    SpaStaticFiles,
+    build_asset_index,
+)
+from app.cli.precompress_assets import precompress
+
+
+@pytest.fixture
+def dist(tmp_path: Path) -> Path:
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<!doctype html><div id=app></div>")
+    (tmp_path / "assets" / "index-BXk2a9_c.js").write_text("console.log('app');" * 200)
+    (tmp_path / "favicon.svg").write_text("<svg/>")
+    (tmp_path / "apple-touch-icon.png").write_bytes(b"png")
+    (tmp_path / "android-chrome-192x192.png").write_bytes(b"png")
+    return tmp_path
+
+
+def _client(dist: Path) -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=SpaStaticFiles(dist)), base_url="http://test")
+
+
+@pytest.mark.anyio
+async def test_hashed_assets_are_immutable_and_precompressed(dist: Path) -> None:
+    assert precompress(dist)[0] == 1
+    async with _client(dist) as client:
+        response = await client.get("/assets/index-BXk2a9_c.js",
+                                    headers={"Accept-Encoding": "gzip"})
+        plain = await client.get("/assets/index-BXk2a9_c.js",
+                                 headers={"Accept-Encoding": "identity"})
+        cached = await client.get("/assets/index-BXk2a9_c.js",
+                                  headers={"Accept-Encoding": "gzip",
+                                           "If-None-Match": response.headers["etag"]})
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "javascript" in response.headers["content-type"]
+    assert response.content == plain.content  # httpx decodes the gzip variant
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] != response.headers["etag"]
+    assert cached.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_client_routes_fall_back_to_index(dist: Path) -> None:
+    async with _client(dist) as client:
+        root = await client.get("/")
+        route = await client.get("/dashboard/settings")
+        missing = await client.get("/assets/missing-12345678.js")
+        api = await client.get("/api/v1/unknown")
+        post = await client.post("/dashboard")
+    assert root.text == route.text == "<!doctype html><div id=app></div>"
+    assert route.headers["cache-control"] == "no-cache"
+    assert missing.status_code == api.status_code == 404
+    assert post.status_code == 405
+
+
+def test_only_vite_hashed_assets_are_immutable(dist: Path) -> None:
+    (dist / "assets" / "logo-1234567.svg").write_text("<svg/>")
+    (dist / "assets" / "vendor-react-dom-a1B2_c3D.js").write_text("")
+    immutable = {name for name, asset in build_asset_index(dist).items() if asset.immutable}
+    assert immutable == {"assets/index-BXk2a9_c.js", "assets/vendor-react-dom-a1B2_c3D.js"}
+
+
+@pytest.mark.anyio
+async def test_zerocopy_sends_pass_through_compression(dist: Path) -> None:
+    app = CompressionMiddleware(SpaStaticFiles(dist, sendfile_min_size=1), minimum_size=16)
+    scope = {
+        "type": "http", "method": "GET", "path": "/assets/index-BXk2a9_c.js", "root_path": "",
+        "query_string": b"", "headers": [(b"accept-encoding", b"gzip, br")],
+        "extensions": {ZEROCOPY_EXTENSION: {}},
+    }
+    sent: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    assert [message["type"] for message in sent] == ["http.response.start", ZEROCOPY_EXTENSION]
+    headers = dict(sent[0]["headers"])
+    assert b"content-encoding" not in headers
+    assert headers[b"content-length"] == str(sent[1]["count"]).encode()
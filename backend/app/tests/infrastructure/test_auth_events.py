@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, date, datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.infrastructure.audit import events
+from app.infrastructure.audit.events import AuthEventBuffer
+from app.infrastructure.audit.partitions import (
+    _next_month,
+    drop_expired_partitions,
+    ensure_partitions,
+)
+
+
+class FakeConnection:
+    def __init__(self, *, existing: Iterable[str] = (), children: Iterable[str] = ()) -> None:
+        self.existing = set(existing)
+        self.children = list(children)
+        self.statements: list[str] = []
+
+    def execute(self, statement: Any, parameters: dict[str, Any] | None = None) -> Any:
+        sql = str(statement)
+        result = MagicMock()
+        if "to_regclass" in sql:
+            result.scalar_one.return_value = (parameters or {})["name"] in self.existing
+        elif "pg_inherits" in sql:
+            result.scalars.return_value = iter(self.children)
+        else:
+            self.statements.append(sql)
+        return result
+
+    def exec_driver_sql(self, sql: str) -> None:
+        self.statements.append(sql)
+
+
+def test_next_month_rolls_over_the_year() -> None:
+    assert _next_month(date(2026, 1, 1)) == date(2026, 2, 1)
+    assert _next_month(date(2026, 12, 1)) == date(2027, 1, 1)
+
+
+def test_missing_partitions_take_over_their_rows_from_the_default_partition() -> None:
+    connection = FakeConnection(existing={"auth_events_202612"})
+    created = ensure_partitions(
+        connection,  # type: ignore[arg-type]
+        now=datetime(2026, 11, 15, tzinfo=UTC), months_ahead=2)
+
+    assert created == ["auth_events_202611", "auth_events_202701"]
+    first = connection.statements[:3]
+    assert first[0].startswith("CREATE TABLE auth_events_202611 (LIKE auth_events")
+    assert "DELETE FROM auth_events_default" in first[1]
+    assert "INSERT INTO auth_events_202611" in first[1]
+    assert first[2] == (
+        "ALTER TABLE auth_events ATTACH PARTITION auth_events_202611 "
+        "FOR VALUES FROM ('2026-11-01 00:00+00') TO ('2026-12-01 00:00+00')")
+
+
+def test_only_partitions_entirely_past_retention_are_dropped() -> None:
+    connection = FakeConnection(children=[
+        "auth_events_default", "auth_events_202604", "auth_events_202605", "auth_events_202606"])
+    dropped = drop_expired_partitions(
+        connection,  # type: ignore[arg-type]
+        now=datetime(2026, 11, 15, tzinfo=UTC), retention_days=180)
+
+    # The cutoff is 2026-05-19, so May still holds rows inside retention.
+    assert dropped == ["auth_events_202604"]
+    assert connection.statements[0] == "DROP TABLE auth_events_202604"
+    assert connection.statements[1].startswith("DELETE FROM auth_events_default")
+
+
+def test_buffer_counts_events_dropped_on_overflow() -> None:
+    buffer = AuthEventBuffer(max_size=2, batch_size=10, flush_interval_seconds=1)
+    for _ in range(3):
+        buffer.record("auth.login")
+
+    assert buffer.snapshot() == {"pending": 2, "recorded": 2, "written": 0, "dropped": 1}
+
+
+@pytest.mark.anyio
+async def test_buffer_counts_a_failed_batch_as_dropped_and_keeps_the_rest(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def unavailable() -> Any:
+        raise ConnectionError("database unavailable")
+
+    monkeypatch.setattr(events, "SessionLocal", unavailable)
+    buffer = AuthEventBuffer(max_size=10, batch_size=2, flush_interval_seconds=1)
+    for _ in range(3):
+        buffer.record("auth.login")
+
+    await buffer.flush()
+
+    assert buffer.snapshot() == {"pending": 1, "recorded": 3, "written": 0, "dropped": 2}
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import os
+import smtplib
+import socket
+from collections.abc import Iterator
+from contextlib import nullcontext
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from aiosmtpd.controller import Controller
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql import Select
+
+from app.domain.models.email_outbox import EmailOutbox
+from app.infrastructure.auth.providers import EmailProvider
+from app.infrastructure.messaging.outbox import drain_outbox
+
+DATABASE_URL = os.environ.get("DATABASE_TEST_URL")
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        self.messages: list[tuple[tuple[str, int], bytes]] = []
+        self.refused: set[str] = set()
+        self.drop_connection_for: set[str] = set()
+
+    async def handle_RCPT(
+        self, _server: Any, _session: Any, envelope: Any, address: str, _options: Any
+    ) -> str:
+        if address in self.refused:
+            return "550 5.1.1 Mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server: Any, session: Any, envelope: Any) -> str:
+        if self.drop_connection_for.intersection(envelope.rcpt_tos):
+            server.transport.close()
+            return "421 4.3.0 Connection dropped"
+        self.messages.append((session.peer, envelope.content))
+        return "250 Message accepted for delivery"
+
+
+@pytest.fixture
+def smtp_server() -> Iterator[tuple[Controller, RecordingHandler]]:
+    handler = RecordingHandler()
+    # aiosmtpd connects to its own port on startup, so it needs a concrete one.
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        yield controller, handler
+    finally:
+        controller.stop()
+
+
+def test_provider_reuses_pooled_connection(
+    smtp_server: tuple[Controller, RecordingHandler],
+) -> None:
+    controller, handler = smtp_server
+    provider = EmailProvider(host="127.0.0.1", port=controller.port, sender="no-reply@example.com")
+    try:
+        for index in range(3):
+            provider.send(provider.build_message(
+                to_email="ada@example.com", subject="Hi", body=f"#{index}",
+                message_key=f"outbox-{index}"))
+    finally:
+        provider.close()
+
+    assert len(handler.messages) == 3
+    assert len({peer for peer, _ in handler.messages}) == 1
+    assert b"Message-ID: <outbox-0@example.com>" in handler.messages[0][1]
+
+
+class FakeSession:
+    def __init__(self, rows: list[EmailOutbox]) -> None:
+        self.rows = rows
+        self.statements: list[Select[Any]] = []
+
+    def __call__(self) -> FakeSession:
+        return self
+
+    def __enter__(self) -> FakeSession:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def begin(self) -> nullcontext[None]:
+        return nullcontext()
+
+    def scalars(self, statement: Select[Any]) -> SimpleNamespace:
+        self.statements.append(statement)
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+def outbox_row(recipient: str, *, attempts: int = 0) -> EmailOutbox:
+    return EmailOutbox(id=uuid4(), idempotency_key=str(uuid4()), recipient=recipient,
+                       subject="Hi", body="Hello", status="pending", attempts=attempts,
+                       next_attempt_at=datetime.now(UTC))
+
+
+def drain(session: FakeSession, provider: EmailProvider, *, batch_size: int = 50) -> int:
+    return drain_outbox(session, provider, batch_size=batch_size,  # type: ignore[arg-type]
+                        max_attempts=3, backoff_seconds=30)
+
+
+@pytest.fixture
+def provider(smtp_server: tuple[Controller, RecordingHandler]) -> Iterator[EmailProvider]:
+    provider = EmailProvider(host="127.0.0.1", port=smtp_server[0].port,
+                             sender="no-reply@example.com")
+    try:
+        yield provider
+    finally:
+        provider.close()
+
+
+def test_drain_claims_due_rows_with_skip_locked_and_sends_them(
+    smtp_server: tuple[Controller, RecordingHandler], provider: EmailProvider,
+) -> None:
+    _, handler = smtp_server
+    rows = [outbox_row(f"user-{index}@example.com") for index in range(3)]
+    session = FakeSession(rows)
+
+    assert drain(session, provider, batch_size=10) == 3
+
+    assert [row.status for row in rows] == ["sent"] * 3
+    assert all(row.sent_at is not None for row in rows)
+    assert len({peer for peer, _ in handler.messages}) == 1
+    assert f"Message-ID: <{rows[0].id}@example.com>".encode() in handler.messages[0][1]
+    (statement,) = session.statements
+    sql = str(statement.compile(dialect=postgresql.dialect()))  # type: ignore[no-untyped-call]
+    assert "email_outbox.status = " in sql
+    assert "email_outbox.next_attempt_at <= " in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert statement.compile().params["param_1"] == 10
+
+
+def test_refused_messages_back_off_then_fail_after_max_attempts(
+    smtp_server: tuple[Controller, RecordingHandler], provider: EmailProvider,
+) -> None:
+    _, handler = smtp_server
+    handler.refused = {"first@example.com", "second@example.com", "last@example.com"}
+    first = outbox_row("first@example.com")
+    second = outbox_row("second@example.com", attempts=1)
+    last = outbox_row("last@example.com", attempts=2)
+    ok = outbox_row("ok@example.com")
+    now = datetime.now(UTC)
+
+    assert drain(FakeSession([first, second, ok, last]), provider) == 1
+
+    assert ok.status == "sent"
+    assert (first.status, first.attempts) == ("pending", 1)
+    assert (second.status, second.attempts) == ("pending", 2)
+    # Exponential backoff: 30s after the first failure, 60s after the second.
+    for row, delay in ((first, 30), (second, 60)):
+        assert abs(row.next_attempt_at - now - timedelta(seconds=delay)) < timedelta(seconds=5)
+    assert first.last_error is not None and "550" in first.last_error
+    assert (last.status, last.attempts) == ("failed", 3)
+    assert last.sent_at is None
+
+
+def test_connection_failure_keeps_earlier_sends_and_retries_only_the_in_flight_row(
+    smtp_server: tuple[Controller, RecordingHandler], provider: EmailProvider,
+) -> None:
+    _, handler = smtp_server
+    handler.drop_connection_for = {"dropped@example.com"}
+    sent, dropped, unsent = (outbox_row(f"{name}@example.com")
+                             for name in ("sent", "dropped", "unsent"))
+    claimed_at = unsent.next_attempt_at
+
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        drain(FakeSession([sent, dropped, unsent]), provider)
+
+    assert sent.status == "sent"
+    assert (dropped.status, dropped.attempts) == ("pending", 1)
+    assert dropped.next_attempt_at > claimed_at
+    assert (unsent.status, unsent.attempts, unsent.next_attempt_at) == (
+        "pending", 0, claimed_at)
+    assert len(handler.messages) == 1
+
+
+# Needs a migrated database (alembic upgrade head), e.g. the compose db service.
+@pytest.mark.skipif(DATABASE_URL is None, reason="DATABASE_TEST_URL is not set")
+def test_drain_skips_rows_locked_by_another_worker(provider: EmailProvider) -> None:
+    engine = create_engine(DATABASE_URL or "")
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    locked, free = outbox_row("locked@outbox.test"), outbox_row("free@outbox.test")
+    try:
+        with session_factory() as session, session.begin():
+            session.add_all([locked, free])
+        with session_factory() as worker, worker.begin():
+            # Another worker is mid-drain on the first row.
+            worker.execute(select(EmailOutbox).where(EmailOutbox.id == locked.id)
+                           .with_for_update())
+            drain_outbox(session_factory, provider, batch_size=50, max_attempts=3,
+                         backoff_seconds=30)
+        with session_factory() as session:
+            statuses = dict(session.execute(
+                select(EmailOutbox.recipient, EmailOutbox.status)
+                .where(EmailOutbox.id.in_([locked.id, free.id]))).tuples().all())
+        assert statuses == {"locked@outbox.test": "pending", "free@outbox.test": "sent"}
+    finally:
+        with session_factory() as session, session.begin():
+            session.execute(delete(EmailOutbox).where(EmailOutbox.id.in_([locked.id, free.id])))
+        engine.dispose()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.deadline import DeadlineExceeded, bounded, request_deadline, set_deadline
+from app.infrastructure.db.loaders import BatchLoader
+
+
+@pytest.mark.anyio
+async def test_batch_loader_coalesces_and_batches_within_a_tick() -> None:
+    calls: list[list[int]] = []
+
+    async def load(keys: list[int]) -> dict[int, str]:
+        calls.append(keys)
+        await asyncio.sleep(0)
+        return {key: f"user-{key}" for key in keys if key != 3}
+
+    loader: BatchLoader[int, str] = BatchLoader(load)
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(3))
+
+    assert results == ["user-1", "user-2", "user-1", None]
+    assert calls == [[1, 2, 3]]
+    assert loader.stats() == {"calls": 4, "coalesced": 1, "batches": 1, "batched_keys": 3}
+
+
+@pytest.mark.anyio
+async def test_batch_loader_propagates_errors_to_every_waiter() -> None:
+    async def load(keys: list[int]) -> dict[int, str]:
+        raise RuntimeError("database unavailable")
+
+    loader: BatchLoader[int, str] = BatchLoader(load)
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.anyio
+async def test_batch_runs_with_the_latest_deadline_of_its_waiters() -> None:
+    seen: list[float | None] = []
+
+    async def load(keys: list[int]) -> dict[int, int]:
+        seen.append(request_deadline.get())
+        return {key: key for key in keys}
+
+    loader: BatchLoader[int, int] = BatchLoader(load)
+
+    async def call(key: int, seconds: float | None) -> int | None:
+        if seconds is not None:
+            set_deadline(seconds)
+        return await loader.load(key)
+
+    # An already expired deadline on one request must not fail the others in its batch.
+    assert list(await asyncio.gather(call(1, -1), call(2, None))) == [1, 2]
+    assert list(await asyncio.gather(call(1, -1), call(2, 30), call(2, 60))) == [1, 2, 2]
+    assert seen[0] is None
+    assert seen[1] == pytest.approx(time.monotonic() + 60, abs=5)
+
+
+@pytest.mark.anyio
+async def test_late_joiner_with_budget_left_reloads_after_a_batch_deadline() -> None:
+    batches: list[float | None] = []
+
+    async def load(keys: list[int]) -> dict[int, int]:
+        batches.append(request_deadline.get())
+        async with bounded("db"):
+            await asyncio.sleep(0.05)
+        return {key: key for key in keys}
+
+    loader: BatchLoader[int, int] = BatchLoader(load)
+
+    async def call(seconds: float | None, delay: float) -> int | None:
+        if seconds is not None:
+            set_deadline(seconds)
+        await asyncio.sleep(delay)
+        return await loader.load(1)
+
+    # The later callers join the first request's batch after it was dispatched.
+    short, long, unbounded = await asyncio.gather(
+        call(0.01, 0), call(30, 0.001), call(None, 0.001), return_exceptions=True)
+
+    assert isinstance(short, DeadlineExceeded) and short.kind == "db"
+    assert long == unbounded == 1
+    assert len(batches) == 2
+    assert batches[1] is None
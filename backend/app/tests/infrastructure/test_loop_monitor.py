@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure.diagnostics.loop_monitor import LagHistogram, LoopMonitor
+
+
+def test_lag_histogram_buckets_by_upper_bound() -> None:
+    histogram = LagHistogram(buckets=(1, 10, 100))
+    for value in (0.0, 1.0, 1.5, 10.0, 99.0, 250.0):
+        histogram.record(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"1": 2, "10": 2, "100": 1, "+Inf": 1}
+    assert snapshot["count"] == 6
+    assert snapshot["max_ms"] == 250.0
+    assert snapshot["mean_ms"] == pytest.approx(361.5 / 6)
+
+
+@pytest.mark.anyio
+async def test_watchdog_reports_a_blocking_call_once_with_its_stack() -> None:
+    monitor = LoopMonitor(interval_ms=10, block_threshold_ms=50)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        time.sleep(0.3)
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    assert len(monitor.blocked_events) == 1
+    event = monitor.blocked_events[0]
+    assert event["stalled_ms"] >= 50
+    assert any("time.sleep(0.3)" in line for line in event["stack"])
+    assert monitor.histogram.max_ms >= 200
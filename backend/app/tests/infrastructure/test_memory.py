@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import tracemalloc
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api.middleware import MemoryTrackingMiddleware
+from app.infrastructure.diagnostics.memory import MemoryTracer, MemoryTracingError
+
+retained: list[bytes] = []
+
+
+def build_app(tracer: MemoryTracer) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MemoryTrackingMiddleware, tracer=tracer)
+
+    @app.get("/leak")
+    async def leak() -> dict[str, int]:
+        retained.extend(bytes(1024) + bytes([i % 256]) for i in range(512))
+        return {"retained": len(retained)}
+
+    return app
+
+
+def make_tracer(**overrides: float) -> MemoryTracer:
+    limits = {"max_seconds": 30, "max_frames": 10, "max_overhead_mb": 64, "max_snapshots": 2}
+    return MemoryTracer(**{**limits, **overrides})  # type: ignore[arg-type]
+
+
+@pytest.mark.anyio
+async def test_allocations_are_attributed_to_the_route() -> None:
+    tracer = make_tracer()
+    app = build_app(tracer)
+    tracer.start(seconds=30, frames=10)
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            for _ in range(3):
+                assert (await client.get("/leak")).status_code == 200
+        stats = tracer.snapshot()["routes"]["GET /leak"]
+        assert stats["requests"] == stats["exclusive_requests"] == 3
+        assert stats["growth_total_bytes"] > 3 * 512 * 1024
+        assert stats["peak_max_bytes"] >= 512 * 1024
+
+        top = tracer.diff(group_by="route", routes=app.routes)[0]
+        assert top["key"] == "GET /leak"
+        assert top["size_diff"] > 3 * 512 * 1024
+        modules = [row["key"] for row in tracer.diff(group_by="module")]
+        assert __name__ in modules
+    finally:
+        await tracer.stop()
+        retained.clear()
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.anyio
+async def test_limits_are_enforced() -> None:
+    tracer = make_tracer(max_overhead_mb=0, check_interval=0.01)
+    with pytest.raises(ValueError):
+        tracer.start(seconds=31, frames=10)
+    with pytest.raises(ValueError):
+        tracer.start(seconds=30, frames=11)
+
+    tracer.start(seconds=30, frames=1)
+    with pytest.raises(MemoryTracingError):
+        tracer.start(seconds=30, frames=1)
+    ids = [tracer.take_snapshot() for _ in range(4)]
+    assert tracer.snapshot()["snapshots"] == ["baseline", *ids[-2:]]
+    with pytest.raises(KeyError):
+        tracer.diff(since=ids[0])
+
+    # tracemalloc's own bookkeeping always exceeds a zero budget.
+    await asyncio.sleep(0.1)
+    assert tracer.snapshot()["stop_reason"] == "overhead_limit"
+    assert not tracemalloc.is_tracing()
+    await tracer.stop()
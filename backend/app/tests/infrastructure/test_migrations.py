@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pytest
+
+from app.infrastructure.db.migrations import (
+    LOCK_RISK_ALLOWED,
+    LockRiskChecker,
+    find_lock_risks,
+    split_script,
+)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "CREATE INDEX ix_users_name ON users (full_name)",
+        "CREATE UNIQUE INDEX ix_users_x ON public.users USING btree (x)",
+        "DROP INDEX ix_users_name",
+        "ALTER TABLE users ALTER COLUMN email TYPE TEXT",
+        "ALTER TABLE users ALTER COLUMN full_name SET NOT NULL",
+        "ALTER TABLE refresh_tokens ADD CONSTRAINT fk FOREIGN KEY (user_id) REFERENCES users (id)",
+        "ALTER TABLE users ADD CONSTRAINT uq_name UNIQUE (full_name)",
+        "ALTER TABLE users ADD COLUMN token UUID DEFAULT gen_random_uuid()",
+        "UPDATE users SET is_active = true",
+        "VACUUM FULL users",
+    ],
+)
+def test_checker_rejects_long_locks_on_existing_tables(statement: str) -> None:
+    assert LockRiskChecker().check(statement) is not None
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_name ON users (full_name)",
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_users_name",
+        "ALTER TABLE users ADD COLUMN nickname VARCHAR(64)",
+        "ALTER TABLE users ADD COLUMN score INTEGER DEFAULT 0 NOT NULL",
+        "ALTER TABLE refresh_tokens ADD CONSTRAINT fk FOREIGN KEY (user_id) "
+        "REFERENCES users (id) NOT VALID",
+        "UPDATE users SET is_active = true WHERE id IN (SELECT id FROM users LIMIT 1000)",
+        f"ALTER TABLE users ALTER COLUMN email TYPE TEXT {LOCK_RISK_ALLOWED}",
+    ],
+)
+def test_checker_allows_online_safe_statements(statement: str) -> None:
+    assert LockRiskChecker().check(statement) is None
+
+
+def test_tables_created_in_the_same_run_are_exempt() -> None:
+    script = """
+-- Running upgrade  -> 0001
+CREATE TABLE widgets (
+    id UUID NOT NULL
+);
+CREATE INDEX ix_widgets_id ON widgets (id);
+-- Running upgrade 0001 -> 0002
+ALTER TABLE widgets ALTER COLUMN id SET NOT NULL;
+CREATE INDEX ix_users_widget ON users (widget_id);
+"""
+    risks = find_lock_risks(split_script(script))
+    assert [(risk.revision, risk.statement) for risk in risks] == [
+        ("0002", "CREATE INDEX ix_users_widget ON users (widget_id)"),
+    ]
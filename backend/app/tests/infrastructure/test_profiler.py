@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import sys
+from types import FrameType
+
+from app.infrastructure.diagnostics.profiler import (
+    TRUNCATED,
+    UNATTRIBUTED,
+    Profile,
+    StackSampler,
+)
+
+
+def handler() -> FrameType:
+    return helper()
+
+
+def helper() -> FrameType:
+    return sys._getframe()
+
+
+def other() -> FrameType:
+    return sys._getframe()
+
+
+def make_sampler(max_stacks: int = 100) -> StackSampler:
+    return StackSampler(thread_id=0, hz=100, max_stacks=max_stacks,
+                        routes={handler.__code__: "GET /api/v1/users"})
+
+
+def test_record_attributes_stacks_to_the_enclosing_route() -> None:
+    profile = Profile()
+    sampler = make_sampler()
+    sampler._record(profile, handler())
+    sampler._record(profile, other())
+
+    routed, unrouted = profile.stacks
+    assert routed.startswith("GET /api/v1/users;")
+    assert routed.endswith(f"{__name__}:handler;{__name__}:helper")
+    assert unrouted.startswith(f"{UNATTRIBUTED};")
+    assert unrouted.endswith(f"{__name__}:other")
+    assert profile.samples == 2
+
+
+def test_record_truncates_new_stacks_past_max_stacks() -> None:
+    profile = Profile()
+    sampler = make_sampler(max_stacks=1)
+    sampler._record(profile, handler())
+    sampler._record(profile, other())
+    sampler._record(profile, handler())
+
+    assert profile.samples == 3
+    assert profile.truncated == 1
+    assert sorted(profile.stacks.values()) == [1, 2]
+    assert profile.stacks[f"{UNATTRIBUTED};{TRUNCATED}"] == 1
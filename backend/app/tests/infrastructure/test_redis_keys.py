@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from redis.asyncio.cluster import RedisCluster
+from redis.crc import key_slot
+
+from app.api import deps
+from app.core.security import create_access_token
+from app.infrastructure.cache.keys import (
+    access_token_key,
+    legacy_access_token_key,
+    user_hash_tag,
+)
+from app.infrastructure.db.loaders import user_loader
+from app.schemas.user import UserRead
+
+CLUSTER_URL = os.environ.get("REDIS_CLUSTER_URL")
+
+
+def test_keys_for_one_user_share_a_slot() -> None:
+    user_id = uuid4()
+    slots = {key_slot(access_token_key(user_id, uuid4())) for _ in range(50)}
+    assert slots == {key_slot(user_hash_tag(user_id))}
+
+
+def test_hash_tags_spread_users_across_slots() -> None:
+    slots = {key_slot(access_token_key(uuid4(), uuid4())) for _ in range(2_000)}
+    assert len(slots) > 1_500
+
+
+class KeySet:
+    def __init__(self, *keys: bytes | str) -> None:
+        self.keys = set(keys)
+
+    async def exists(self, key: bytes | str) -> int:
+        return int(key in self.keys)
+
+
+@pytest.mark.anyio
+async def test_legacy_keys_are_honoured_for_one_token_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    user_id = uuid4()
+    access = create_access_token(str(user_id))
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access["token"])
+    now = datetime.now(UTC)
+    user = UserRead(id=user_id, email="ada@example.com", is_active=True, is_superuser=False,
+                    created_at=now, updated_at=now)
+    monkeypatch.setattr(user_loader, "load", AsyncMock(return_value=user))
+    redis = KeySet(legacy_access_token_key(UUID(access["jti"])))
+
+    assert await deps.get_current_user(credentials, redis) is user  # type: ignore[arg-type]
+
+    monkeypatch.setattr(deps, "legacy_access_keys_until", 0.0)
+    with pytest.raises(HTTPException) as exc_info:
+        await deps.get_current_user(credentials, redis)  # type: ignore[arg-type]
+    assert exc_info.value.status_code == 401
+
+
+# Runs against the docker-compose.redis-cluster.yml stack; see the root README.
+@pytest.mark.skipif(CLUSTER_URL is None, reason="REDIS_CLUSTER_URL is not set")
+@pytest.mark.anyio
+async def test_multi_key_commands_stay_single_slot_on_a_cluster() -> None:
+    # types-redis has no stubs for the cluster client's commands.
+    client: Any = RedisCluster.from_url(CLUSTER_URL or "")
+    user_id = uuid4()
+    keys = [access_token_key(user_id, uuid4()) for _ in range(5)]
+    try:
+        pipe = client.pipeline()
+        for key in keys:
+            pipe.set(key, b"", ex=60)
+        await pipe.execute()
+        # EXISTS with several keys fails with CROSSSLOT unless they share a slot.
+        assert await client.exists(*keys) == len(keys)
+        assert await client.delete(*keys) == len(keys)
+    finally:
+        await client.aclose()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.db import slow_query
+from app.infrastructure.db.slow_query import (
+    SlowQueryLog,
+    _explainable,
+    normalize_sql,
+    parameter_shape,
+)
+
+
+def test_normalize_sql_collapses_whitespace_and_truncates() -> None:
+    assert normalize_sql("\n  SELECT id\n\tFROM users   WHERE id = %(id)s \n") == (
+        "SELECT id FROM users WHERE id = %(id)s")
+    assert len(normalize_sql("SELECT " + "x, " * 1_000)) == 2_000
+
+
+def test_parameter_shape_reports_types_not_values() -> None:
+    user_id = UUID(int=1)
+    assert parameter_shape(None) is None
+    assert parameter_shape({"id": user_id, "email": "ada@example.com"}) == {
+        "id": "UUID", "email": "str"}
+    assert parameter_shape((user_id, 3)) == ["UUID", "int"]
+    assert parameter_shape([{"at": datetime(2026, 1, 1)}] * 3, executemany=True) == {
+        "rows": 3, "row": {"at": "datetime"}}
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("SELECT * FROM users WHERE id = %(id)s", True),
+        ("  select count(*) from users", True),
+        ("SELECT * FROM users WHERE id = %(id)s FOR UPDATE", False),
+        ("SELECT * FROM users\nFOR UPDATE SKIP LOCKED", False),
+        ("SELECT * FROM users FOR NO KEY UPDATE", False),
+        ("SELECT * FROM users FOR KEY SHARE", False),
+        ("SELECT * FROM users FOR SHARE", False),
+        ("SELECT * INTO users_copy FROM users", False),
+        ("UPDATE users SET is_active = false", False),
+        ("WITH gone AS (DELETE FROM users RETURNING id) SELECT * FROM gone", False),
+    ],
+)
+def test_only_plain_reads_are_explained(statement: str, expected: bool) -> None:
+    assert _explainable(statement) is expected
+
+
+@pytest.mark.anyio
+async def test_explain_is_rate_limited(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1_000.0]
+    monkeypatch.setattr(slow_query.time, "monotonic", lambda: now[0])
+    log = SlowQueryLog(
+        create_async_engine("postgresql+psycopg_async://localhost/unused"),
+        threshold_ms=100,
+        explain=True,
+        explain_interval_seconds=60,
+    )
+    explained: list[str] = []
+
+    async def fake_explain(statement: str, *_: Any) -> None:
+        explained.append(statement)
+
+    monkeypatch.setattr(log, "_explain", fake_explain)
+
+    for statement in ("SELECT 1", "SELECT 2"):
+        log._maybe_explain(statement, None, statement)
+    now[0] += 59
+    log._maybe_explain("SELECT 3", None, "SELECT 3")
+    now[0] += 1
+    log._maybe_explain("SELECT 4", None, "SELECT 4")
+    await asyncio.gather(*log._tasks)
+
+    assert explained == ["SELECT 1", "SELECT 4"]
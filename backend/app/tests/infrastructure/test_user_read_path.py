@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.domain.models.user import User
+from app.infrastructure.db.repositories.users import USER_READ_COLUMNS, UserRepository
+from app.schemas.user import UserRead
+
+DATABASE_URL = os.environ.get("DATABASE_TEST_URL")
+
+
+def test_projected_columns_cover_exactly_the_read_schema() -> None:
+    assert {column.key for column in USER_READ_COLUMNS} == set(UserRead.model_fields)
+
+
+def test_projected_row_builds_the_same_user_read_as_the_orm_path() -> None:
+    now = datetime.now(UTC)
+    user = User(id=uuid4(), email="ada@example.com", hashed_password="x", full_name="Ada",
+                is_active=True, is_superuser=False, created_at=now, updated_at=now)
+    # The same mapping a Row selected from USER_READ_COLUMNS exposes via row._mapping.
+    mapping = {column.key: getattr(user, column.key) for column in USER_READ_COLUMNS}
+
+    projected = UserRead.model_construct(**mapping)
+    assert projected == UserRead.model_validate(user)
+    assert projected.model_dump(mode="json") == UserRead.model_validate(user).model_dump(
+        mode="json")
+
+
+@pytest.mark.skipif(DATABASE_URL is None, reason="DATABASE_TEST_URL is not set")
+@pytest.mark.anyio
+async def test_rows_from_postgres_match_the_orm_read() -> None:
+    engine = create_async_engine(DATABASE_URL or "")
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            session = AsyncSession(bind=connection, expire_on_commit=False)
+            try:
+                user = User(email="read-path@search.test", hashed_password="x")
+                session.add(user)
+                await session.flush()
+                repo = UserRepository(session)
+                (row,) = await repo.get_many_read([user.id])
+                orm_user = await repo.get(user.id)
+                assert UserRead.model_construct(**row._mapping) == UserRead.model_validate(
+                    orm_user)
+            finally:
+                await session.close()
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
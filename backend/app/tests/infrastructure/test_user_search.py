@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.domain.models.user import User
+from app.infrastructure.db.repositories.users import UserRepository
+
+DATABASE_URL = os.environ.get("DATABASE_TEST_URL")
+
+
+# Needs a migrated database (alembic upgrade head), e.g. the compose db service.
+@pytest.mark.skipif(DATABASE_URL is None, reason="DATABASE_TEST_URL is not set")
+@pytest.mark.anyio
+async def test_fuzzy_pages_keep_rows_tied_with_the_cursor() -> None:
+    engine = create_async_engine(DATABASE_URL or "")
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            session = AsyncSession(bind=connection, expire_on_commit=False)
+            try:
+                # Identical names give every row the same non-trivial score.
+                users = [User(email=f"tie-{i}@search.test", hashed_password="x",
+                              full_name="Zebulon Quaxworth") for i in range(5)]
+                session.add_all(users)
+                await session.flush()
+                repo = UserRepository(session)
+
+                seen: list[UUID] = []
+                after: tuple[float, UUID] | None = None
+                while True:
+                    rows = await repo.search_fuzzy("zebulon quaxwort", limit=2, after=after)
+                    seen.extend(user.id for user, _ in rows)
+                    if len(rows) < 2:
+                        break
+                    last_user, last_score = rows[-1]
+                    after = (last_score, last_user.id)
+
+                ids = [user.id for user in users]
+                assert [user_id for user_id in seen if user_id in ids] == sorted(ids)
+            finally:
+                await session.close()
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from app.services.user_import import ImportedUser, read_csv, read_ndjson
+
+
+def test_read_csv_accepts_plain_and_hashed_passwords() -> None:
+    stream = io.StringIO(
+        "email,full_name,password,hashed_password\n"
+        "ada@example.com,Ada,secret,\n"
+        "bob@example.com,,,$2b$12$hash\n"
+    )
+    assert list(read_csv(stream)) == [
+        ImportedUser(email="ada@example.com", full_name="Ada", password="secret"),
+        ImportedUser(email="bob@example.com", hashed_password="$2b$12$hash"),
+    ]
+
+
+def test_read_ndjson_skips_blank_lines() -> None:
+    stream = io.StringIO('{"email": "ada@example.com", "password": "secret"}\n\n')
+    assert list(read_ndjson(stream)) == [
+        ImportedUser(email="ada@example.com", password="secret")]
+
+
+def test_records_without_credentials_are_rejected() -> None:
+    stream = io.StringIO('{"email": "ada@example.com"}\n')
+    with pytest.raises(ValueError, match="Record 1"):
+        list(read_ndjson(stream))
+
+
+def test_emails_are_normalised_like_registration() -> None:
+    stream = io.StringIO('{"email": " Ada@EXAMPLE.com ", "password": "secret"}\n')
+    assert [user.email for user in read_ndjson(stream)] == ["Ada@example.com"]
+
+
+def test_invalid_emails_are_rejected_with_their_record_number() -> None:
+    stream = io.StringIO(
+        "email,password\n"
+        "ada@example.com,secret\n"
+        "not-an-email,secret\n"
+    )
+    with pytest.raises(ValueError, match="Record 2: invalid email 'not-an-email'"):
+        list(read_csv(stream))
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.user import UserCreate
+from app.services import users
+from app.services.users import UserService
+
+
+@pytest.mark.anyio
+async def test_register_user_rolls_back_on_duplicate_email(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(users, "get_password_hash", lambda _: "hashed")
+    session = AsyncMock(spec=AsyncSession)
+    service = UserService(session)
+    # ON CONFLICT DO NOTHING returns no row when the email is taken.
+    service.users.create = AsyncMock(return_value=None)  # type: ignore[method-assign]
+    service.outbox.enqueue = AsyncMock()  # type: ignore[method-assign]
+
+    with pytest.raises(ValueError, match="already exists"):
+        await service.register_user(UserCreate(email="ada@example.com", password="secret123"))
+
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_awaited()
+    service.outbox.enqueue.assert_not_awaited()
@@ -0,0 +1,76 @@
+"""Compare Redis memory per active session for the legacy and compact token key schemes.
+
+Usage:
+    uv run python benchmarks/redis_token_memory.py --url redis://localhost:6379/15 --sessions 100000
+
+Point ``--url`` at a scratch database; the script only deletes the keys it writes.
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterator
+from itertools import islice
+from uuid import UUID, uuid4
+
+from redis import Redis
+
+from app.infrastructure.cache.keys import access_token_key
+
+ACCESS_TTL = 900
+REFRESH_TTL = 604_800
+CHUNK = 5_000
+
+Writer = Callable[[Redis, UUID], list[bytes | str]]
+
+
+def write_legacy(client: Redis, user_id: UUID) -> list[bytes | str]:
+    access_key = f"access:{uuid4()}"
+    refresh_key = f"refresh:{uuid4()}"
+    pipe = client.pipeline(transaction=False)
+    pipe.setex(access_key, ACCESS_TTL, str(user_id))
+    pipe.setex(refresh_key, REFRESH_TTL, str(user_id))
+    pipe.execute()
+    return [access_key, refresh_key]
+
+
+def write_compact(client: Redis, user_id: UUID) -> list[bytes | str]:
+    access_key = access_token_key(user_id, uuid4())
+    client.set(access_key, b"", ex=ACCESS_TTL)
+    return [access_key]
+
+
+def _chunks(items: list[bytes | str]) -> Iterator[list[bytes | str]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, CHUNK)):
+        yield chunk
+
+
+def measure(client: Redis, sessions: int, writer: Writer) -> float:
+    before = int(client.info("memory")["used_memory"])
+    keys: list[bytes | str] = []
+    user_ids = [uuid4() for _ in range(max(1, sessions // 3))]
+    for index in range(sessions):
+        keys.extend(writer(client, user_ids[index % len(user_ids)]))
+    after = int(client.info("memory")["used_memory"])
+    for chunk in _chunks(keys):
+        client.delete(*chunk)
+    return (after - before) / sessions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="redis://localhost:6379/15")
+    parser.add_argument("--sessions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    client = Redis.from_url(args.url)
+    legacy = measure(client, args.sessions, write_legacy)
+    compact = measure(client, args.sessions, write_compact)
+    print(f"sessions={args.sessions}")
+    print(f"legacy  bytes/session={legacy:.1f}")
+    print(f"compact bytes/session={compact:.1f}")
+    print(f"saved   {100 * (1 - compact / legacy):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
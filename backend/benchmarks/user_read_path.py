@@ -0,0 +1,99 @@
+"""Compare CPU time and peak allocations of the ORM and column-projected user read paths.
+
+Usage:
+    uv run python benchmarks/user_read_path.py --seed 1000 --iterations 200
+
+Runs against the configured database. ``--seed`` inserts throwaway
+``bench-*@example.invalid`` users and removes them again afterwards.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+from sqlalchemy import delete, insert, select
+
+from app.domain.models.user import User
+from app.infrastructure.db.repositories.users import UserRepository
+from app.infrastructure.db.session import SessionLocal, engine
+from app.schemas.user import UserRead
+
+SEED_DOMAIN = "@example.invalid"
+
+Path = Callable[[], Awaitable[list[UserRead]]]
+
+
+async def orm_path() -> list[UserRead]:
+    async with SessionLocal() as session:
+        result = await session.execute(select(User).order_by(User.created_at.desc()))
+        return [UserRead.model_validate(user) for user in result.scalars().all()]
+
+
+async def projected_path() -> list[UserRead]:
+    async with SessionLocal() as session:
+        rows = await UserRepository(session).list_read()
+        return [UserRead.model_construct(**row._mapping) for row in rows]
+
+
+async def measure(path: Path, iterations: int) -> tuple[float, float, int]:
+    await path()  # warm the pool and statement caches
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    for _ in range(iterations):
+        await path()
+    wall = (time.perf_counter() - started) / iterations
+    cpu = (time.process_time() - cpu_started) / iterations
+    tracemalloc.start()
+    await path()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return wall * 1000, cpu * 1000, peak
+
+
+async def seed(count: int) -> None:
+    rows = [
+        {"id": uuid4(), "email": f"bench-{index}{SEED_DOMAIN}",
+         "hashed_password": "x" * 60, "full_name": f"Bench User {index}"}
+        for index in range(count)
+    ]
+    async with SessionLocal() as session:
+        await session.execute(insert(User), rows)
+        await session.commit()
+
+
+async def cleanup() -> None:
+    async with SessionLocal() as session:
+        await session.execute(delete(User).where(User.email.like(f"bench-%{SEED_DOMAIN}")))
+        await session.commit()
+
+
+async def run(iterations: int, seed_count: int) -> None:
+    if seed_count:
+        await seed(seed_count)
+    try:
+        orm = await measure(orm_path, iterations)
+        projected = await measure(projected_path, iterations)
+    finally:
+        if seed_count:
+            await cleanup()
+        await engine.dispose()
+    print(f"iterations={iterations}")
+    for name, (wall, cpu, peak) in (("orm", orm), ("projected", projected)):
+        print(f"{name:<9} wall={wall:.2f}ms cpu={cpu:.2f}ms peak={peak / 1024:.1f}KiB")
+    print(f"cpu saved {100 * (1 - projected[1] / orm[1]):.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, args.seed))
+
+
+if __name__ == "__main__":
+    main()